@@ -0,0 +1,235 @@
+"""
+Benchmarks the pel.py pipeline on synthetic feeds and knowledge bases.
+
+    python bench.py --items 1000 10000 --kb-sizes 150 1000 --output bench.json
+
+Each (items, kb size) combination times parse_rss_feed, infer_subject_from_title,
+assign_episodes, resolve_inferred_nodes and finalize_nodes plus generate_html,
+then reruns them under tracemalloc for peak memory. The report is JSON so runs can be diffed to catch regressions.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from xml.sax.saxutils import escape
+
+import pel
+
+TOPICS = [
+    "Ethics", "Free Will", "the Self", "Justice", "Language", "Time", "Death", "Beauty",
+    "Knowledge", "Mind", "God", "Love", "Power", "Truth", "Virtue", "Nature", "Freedom",
+]
+BOOKS = ["Logic", "Critique", "Meditations", "Dialogues", "Essays", "Lectures", "Notebooks", "Letters"]
+FIRST_NAMES = ["Anna", "David", "Elena", "Frank", "Grace", "Hugo", "Iris", "Jonas", "Karin", "Leo", "Maya", "Noah"]
+SYLLABLES = ["ka", "ren", "tho", "vel", "mar", "sti", "lo", "ber", "quin", "dra", "zel", "mon", "fi", "gar"]
+
+def synthetic_surname(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+
+def synthetic_title(rng, number, kb_names):
+    """Title shapes seen in the real feed, mixing known names and unknown guests."""
+    name = rng.choice(kb_names) if rng.random() < 0.6 else f"{rng.choice(FIRST_NAMES)} {synthetic_surname(rng)}"
+    topic = rng.choice(TOPICS)
+    shape = rng.randrange(7)
+    if shape == 0:
+        return f"Ep. {number}: {name} on {topic} (Part One)"
+    if shape == 1:
+        return f"Ep. {number}: {name}'s {rng.choice(BOOKS)}"
+    if shape == 2:
+        return f"Closereads: {name} on {topic}"
+    if shape == 3:
+        return f"Nightcap: {topic} and {rng.choice(TOPICS)}"
+    if shape == 4:
+        return f"Episode {number}: {name} and the Problem of {topic}"
+    if shape == 5:
+        return f"{rng.choice(FIRST_NAMES)} {synthetic_surname(rng)} Interview on {topic}"
+    return f"Ep. {number}: {topic} Without {name}"
+
+def write_synthetic_feed(path, items, kb_names, seed=0):
+    """Streams an RSS file with the same item layout as pel.xml."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"><channel>\n')
+        f.write("<title>Synthetic Feed</title>\n")
+        for i in range(items):
+            number = items - i
+            guid = 10_000_000 + i
+            f.write(
+                "<item>"
+                f"<title>{escape(synthetic_title(rng, number, kb_names))}</title>"
+                f"<link>https://www.patreon.com/posts/ep-{number}-{guid}</link>"
+                f"<itunes:duration>{rng.randint(600, 9000)}</itunes:duration>"
+                f"<description>{'Lorem ipsum dolor sit amet. ' * 8}</description>"
+                f'<enclosure url="https://cdn.example.com/media/{guid}/1.mp3?token-time=1765756800" '
+                f'length="{rng.randint(10**7, 10**8)}" type="audio/mpeg"></enclosure>'
+                f'<guid isPermaLink="false">{guid}</guid>'
+                f"<pubDate>Sat, 06 Dec 2025 22:42:{i % 60:02d} GMT</pubDate>"
+                "</item>\n"
+            )
+        f.write("</channel></rss>\n")
+
+def synthetic_knowledge_base(entries, seed=0):
+    """The real KNOWLEDGE_BASE padded with generated entries up to the requested size."""
+    rng = random.Random(seed)
+    db = dict(list(pel.KNOWLEDGE_BASE.items())[:entries])
+    keys = list(db)
+    seen = {pel.normalize(kw) for info in db.values() for kw in info['keywords']}
+    while len(db) < entries:
+        surname = synthetic_surname(rng)
+        if pel.normalize(surname) in seen:
+            continue
+        seen.add(pel.normalize(surname))
+        key = f"synthetic_{len(db)}"
+        db[key] = {
+            "name": f"{rng.choice(FIRST_NAMES)} {surname}",
+            "category": rng.choice(["Ancient", "Modern", "Analytic", "Continental", "Eastern"]),
+            "sep": "",
+            "deps": rng.sample(keys, min(len(keys), rng.randint(0, 3))),
+            "keywords": [surname] + [f"{surname} {rng.choice(BOOKS)}" for _ in range(rng.randint(0, 2))],
+            "aliases": [surname],
+        }
+        keys.append(key)
+    return db
+
+def infer_all(episodes):
+    for ep in episodes:
+        pel.infer_subject_from_title(ep['title'])
+    return episodes
+
+def resolve_all(output_data, db):
+    pel.resolve_inferred_nodes(output_data, db)
+    return output_data
+
+def run_stages(feed_path, db):
+    """
+    Runs each pipeline stage once; returns ({stage: seconds}, episode count,
+    node count). The title inference cache is emptied before every stage, so
+    repeats and later stages pay for inference like a fresh run does.
+    """
+    timings = {}
+
+    pel.infer_subject_from_title.cache_clear()
+    start = time.perf_counter()
+    episodes = pel.parse_rss_feed(feed_path)
+    timings['parse'] = time.perf_counter() - start
+
+    pel.infer_subject_from_title.cache_clear()
+    start = time.perf_counter()
+    infer_all(episodes)
+    timings['infer'] = time.perf_counter() - start
+
+    pel.infer_subject_from_title.cache_clear()
+    start = time.perf_counter()
+    output_data = pel.assign_episodes(episodes, db)
+    timings['categorize'] = time.perf_counter() - start
+
+    pel.infer_subject_from_title.cache_clear()
+    start = time.perf_counter()
+    pel.resolve_inferred_nodes(output_data, db)
+    timings['resolve'] = time.perf_counter() - start
+
+    pel.infer_subject_from_title.cache_clear()
+    start = time.perf_counter()
+    final_data = pel.finalize_nodes(output_data)
+    pel.generate_html(final_data)
+    timings['render'] = time.perf_counter() - start
+
+    return timings, len(episodes), len(final_data)
+
+def peak_memory(feed_path, db):
+    """Peak traced allocation per stage, measured in a separate pass."""
+    peaks = {}
+    stages = [
+        ('parse', lambda _: pel.parse_rss_feed(feed_path)),
+        ('infer', infer_all),
+        ('categorize', lambda eps: pel.assign_episodes(eps, db)),
+        ('resolve', lambda nodes: resolve_all(nodes, db)),
+        ('render', lambda nodes: pel.generate_html(pel.finalize_nodes(nodes))),
+    ]
+    value = None
+    tracemalloc.start()
+    try:
+        for name, stage in stages:
+            pel.infer_subject_from_title.cache_clear()
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            value = stage(value)
+            peaks[name] = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+def benchmark(items, kb_entries, repeat=1, memory=True, seed=0):
+    db = synthetic_knowledge_base(kb_entries, seed)
+    kb_names = [info['keywords'][0] for info in db.values() if info['keywords']]
+    with tempfile.TemporaryDirectory() as tmp:
+        feed_path = os.path.join(tmp, "feed.xml")
+        write_synthetic_feed(feed_path, items, kb_names, seed)
+        feed_bytes = os.path.getsize(feed_path)
+
+        # generate_html writes into the working directory
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                runs = [run_stages(feed_path, db) for _ in range(repeat)]
+                peaks = peak_memory(feed_path, db) if memory else {}
+            output_bytes = os.path.getsize(os.path.join(tmp, "index.html"))
+        finally:
+            os.chdir(cwd)
+
+    stages = {}
+    for name in runs[0][0]:
+        stages[name] = {"seconds": min(run[0][name] for run in runs)}
+        if name in peaks:
+            stages[name]["peak_bytes"] = peaks[name]
+    return {
+        "items": items,
+        "kb_entries": len(db),
+        "feed_bytes": feed_bytes,
+        "episodes": runs[0][1],
+        "nodes": runs[0][2],
+        "output_bytes": output_bytes,
+        "stages": stages,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks pel.py stages on synthetic feeds.")
+    parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000], help="Feed sizes to generate")
+    parser.add_argument("--kb-sizes", type=int, nargs="+", default=[150, 1000], help="Knowledge base sizes to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per combination; the fastest is reported")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass (it is slow on big feeds)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    for items in args.items:
+        for kb_entries in args.kb_sizes:
+            result = benchmark(items, kb_entries, args.repeat, not args.no_memory, args.seed)
+            results.append(result)
+            summary = ", ".join(f"{name} {stage['seconds']:.3f}s" for name, stage in result['stages'].items())
+            print(f"items={items} kb={result['kb_entries']}: {summary}", file=sys.stderr)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
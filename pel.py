@@ -1,106 +1,144 @@
 import xml.etree.ElementTree as ET
+import ast
 import json
 import re
 import os
+import sqlite3
+import sys
+import argparse
+import gzip
+import hashlib
+import heapq
+import http.client
+import io
+import itertools
+import threading
+import time
+import unicodedata
+import zlib
+from array import array
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache, partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qs, urljoin, urlsplit
+
+try:
+    import numpy as np
+except ImportError:  # only needed for the precomputed layout
+    np = None
+
+try:
+    import brotli
+except ImportError:  # only needed for .br files in --production builds
+    brotli = None
+
+try:
+    import resource
+except ImportError:  # not on Windows; --metrics then leaves out peak memory
+    resource = None
 
 # --- PHASE 1: CORE KNOWLEDGE BASE (Manually Curated) ---
 # We keep this for high-quality metadata (SEP links, Dependencies)
+# "aliases" are the other names the people behind an entry go by, for entity resolution
 KNOWLEDGE_BASE = {
     # --- Ancient ---
-    "presocratics": {"name": "Pre-Socratics", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/presocratics/", "deps": [], "keywords": ["Heraclitus", "Parmenides", "Thales", "Empedocles", "Zeno"]},
+    "presocratics": {"name": "Pre-Socratics", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/presocratics/", "deps": [], "keywords": ["Heraclitus", "Parmenides", "Thales", "Empedocles", "Zeno"], "aliases": ["Heraclitus", "Parmenides", "Thales", "Empedocles", "Zeno"]},
     "socrates": {"name": "Socrates", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/socrates/", "deps": ["presocratics"], "keywords": ["Socrates"]},
     "plato": {"name": "Plato", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/plato/", "deps": ["socrates"], "keywords": ["Plato", "Republic", "Symposium", "Phaedo", "Apology", "Euthyphro", "Meno", "Gorgias", "Cratylus", "Sophist", "Theaetetus", "Philebus", "Timaeus", "Laws"]},
     "aristotle": {"name": "Aristotle", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/aristotle/", "deps": ["plato"], "keywords": ["Aristotle", "Nicomachean", "De Anima", "Metaphysics", "Poetics", "Politics"]},
-    "stoicism": {"name": "Stoicism", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/stoicism/", "deps": ["socrates"], "keywords": ["Stoic", "Epictetus", "Marcus Aurelius", "Seneca"]},
-    "epicureanism": {"name": "Epicureanism", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/epicureanism/", "deps": ["presocratics"], "keywords": ["Epicurus", "Epicurean", "Lucretius"]},
-    "skepticism": {"name": "Skepticism", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/skepticism-ancient/", "deps": [], "keywords": ["Sextus Empiricus", "Pyrrho", "Skepticism"]},
+    "stoicism": {"name": "Stoicism", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/stoicism/", "deps": ["socrates"], "keywords": ["Stoic", "Epictetus", "Marcus Aurelius", "Seneca"], "aliases": ["Epictetus", "Marcus Aurelius", "Seneca"]},
+    "epicureanism": {"name": "Epicureanism", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/epicureanism/", "deps": ["presocratics"], "keywords": ["Epicurus", "Epicurean", "Lucretius"], "aliases": ["Epicurus", "Lucretius"]},
+    "skepticism": {"name": "Skepticism", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/skepticism-ancient/", "deps": [], "keywords": ["Sextus Empiricus", "Pyrrho", "Skepticism"], "aliases": ["Sextus Empiricus", "Pyrrho"]},
     "plotinus": {"name": "Plotinus", "category": "Ancient", "sep": "https://plato.stanford.edu/entries/plotinus/", "deps": ["plato"], "keywords": ["Plotinus", "Neoplatonism"]},
 
     # --- Medieval & Renaissance ---
     "augustine": {"name": "Augustine", "category": "Medieval", "sep": "https://plato.stanford.edu/entries/augustine/", "deps": ["plato", "plotinus"], "keywords": ["Augustine"]},
-    "aquinas": {"name": "Thomas Aquinas", "category": "Medieval", "sep": "https://plato.stanford.edu/entries/aquinas/", "deps": ["aristotle", "augustine"], "keywords": ["Aquinas"]},
+    "aquinas": {"name": "Thomas Aquinas", "category": "Medieval", "sep": "https://plato.stanford.edu/entries/aquinas/", "deps": ["aristotle", "augustine"], "keywords": ["Aquinas"], "aliases": ["Aquinas"]},
     "maimonides": {"name": "Maimonides", "category": "Medieval", "sep": "https://plato.stanford.edu/entries/maimonides/", "deps": ["aristotle"], "keywords": ["Maimonides"]},
     "al-kindi": {"name": "Al-Kindi", "category": "Medieval", "sep": "https://plato.stanford.edu/entries/al-kindi/", "deps": ["aristotle", "plotinus"], "keywords": ["Al-Kindi"]},
     "machiavelli": {"name": "Machiavelli", "category": "Renaissance", "sep": "https://plato.stanford.edu/entries/machiavelli/", "deps": [], "keywords": ["Machiavelli", "The Prince"]},
     "montaigne": {"name": "Montaigne", "category": "Renaissance", "sep": "https://plato.stanford.edu/entries/montaigne/", "deps": ["skepticism"], "keywords": ["Montaigne"]},
-    "ficino": {"name": "Marsilio Ficino", "category": "Renaissance", "sep": "https://plato.stanford.edu/entries/ficino/", "deps": ["plato", "plotinus"], "keywords": ["Ficino"]},
+    "ficino": {"name": "Marsilio Ficino", "category": "Renaissance", "sep": "https://plato.stanford.edu/entries/ficino/", "deps": ["plato", "plotinus"], "keywords": ["Ficino"], "aliases": ["Ficino"]},
     "erasmus": {"name": "Erasmus", "category": "Renaissance", "sep": "https://plato.stanford.edu/entries/erasmus/", "deps": [], "keywords": ["Erasmus"]},
 
     # --- Modern (17th-18th C) ---
-    "hobbes": {"name": "Thomas Hobbes", "category": "Modern", "sep": "https://plato.stanford.edu/entries/hobbes/", "deps": ["machiavelli"], "keywords": ["Hobbes", "Leviathan"]},
-    "descartes": {"name": "René Descartes", "category": "Modern", "sep": "https://plato.stanford.edu/entries/descartes/", "deps": ["augustine", "skepticism"], "keywords": ["Descartes", "Meditations"]},
-    "spinoza": {"name": "Baruch Spinoza", "category": "Modern", "sep": "https://plato.stanford.edu/entries/spinoza/", "deps": ["descartes", "hobbes"], "keywords": ["Spinoza"]},
-    "leibniz": {"name": "Gottfried Leibniz", "category": "Modern", "sep": "https://plato.stanford.edu/entries/leibniz/", "deps": ["descartes", "spinoza"], "keywords": ["Leibniz", "Monadology"]},
-    "malebranche": {"name": "Nicolas Malebranche", "category": "Modern", "sep": "https://plato.stanford.edu/entries/malebranche/", "deps": ["descartes", "augustine"], "keywords": ["Malebranche"]},
-    "pascal": {"name": "Blaise Pascal", "category": "Modern", "sep": "https://plato.stanford.edu/entries/pascal/", "deps": ["montaigne", "descartes"], "keywords": ["Pascal"]},
-    "locke": {"name": "John Locke", "category": "Modern", "sep": "https://plato.stanford.edu/entries/locke/", "deps": ["descartes", "hobbes"], "keywords": ["Locke"]},
-    "berkeley": {"name": "George Berkeley", "category": "Modern", "sep": "https://plato.stanford.edu/entries/berkeley/", "deps": ["locke"], "keywords": ["Berkeley"]},
-    "hume": {"name": "David Hume", "category": "Modern", "sep": "https://plato.stanford.edu/entries/hume/", "deps": ["locke", "berkeley", "hutcheson"], "keywords": ["Hume"]},
+    "hobbes": {"name": "Thomas Hobbes", "category": "Modern", "sep": "https://plato.stanford.edu/entries/hobbes/", "deps": ["machiavelli"], "keywords": ["Hobbes", "Leviathan"], "aliases": ["Hobbes"]},
+    "descartes": {"name": "René Descartes", "category": "Modern", "sep": "https://plato.stanford.edu/entries/descartes/", "deps": ["augustine", "skepticism"], "keywords": ["Descartes", "Meditations"], "aliases": ["Descartes"]},
+    "spinoza": {"name": "Baruch Spinoza", "category": "Modern", "sep": "https://plato.stanford.edu/entries/spinoza/", "deps": ["descartes", "hobbes"], "keywords": ["Spinoza"], "aliases": ["Spinoza"]},
+    "leibniz": {"name": "Gottfried Leibniz", "category": "Modern", "sep": "https://plato.stanford.edu/entries/leibniz/", "deps": ["descartes", "spinoza"], "keywords": ["Leibniz", "Monadology"], "aliases": ["Leibniz"]},
+    "malebranche": {"name": "Nicolas Malebranche", "category": "Modern", "sep": "https://plato.stanford.edu/entries/malebranche/", "deps": ["descartes", "augustine"], "keywords": ["Malebranche"], "aliases": ["Malebranche"]},
+    "pascal": {"name": "Blaise Pascal", "category": "Modern", "sep": "https://plato.stanford.edu/entries/pascal/", "deps": ["montaigne", "descartes"], "keywords": ["Pascal"], "aliases": ["Pascal"]},
+    "locke": {"name": "John Locke", "category": "Modern", "sep": "https://plato.stanford.edu/entries/locke/", "deps": ["descartes", "hobbes"], "keywords": ["Locke"], "aliases": ["Locke"]},
+    "berkeley": {"name": "George Berkeley", "category": "Modern", "sep": "https://plato.stanford.edu/entries/berkeley/", "deps": ["locke"], "keywords": ["Berkeley"], "aliases": ["Berkeley"]},
+    "hume": {"name": "David Hume", "category": "Modern", "sep": "https://plato.stanford.edu/entries/hume/", "deps": ["locke", "berkeley", "hutcheson"], "keywords": ["Hume"], "aliases": ["Hume"]},
     "smith": {"name": "Adam Smith", "category": "Modern", "sep": "https://plato.stanford.edu/entries/smith-moral-political/", "deps": ["hume"], "keywords": ["Adam Smith"]},
-    "rousseau": {"name": "Jean-Jacques Rousseau", "category": "Modern", "sep": "https://plato.stanford.edu/entries/rousseau/", "deps": ["hobbes", "locke"], "keywords": ["Rousseau"]},
-    "kant": {"name": "Immanuel Kant", "category": "Modern", "sep": "https://plato.stanford.edu/entries/kant/", "deps": ["hume", "leibniz", "rousseau"], "keywords": ["Kant", "Critique"]},
-    "burke": {"name": "Edmund Burke", "category": "Modern", "sep": "https://plato.stanford.edu/entries/burke/", "deps": ["locke"], "keywords": ["Burke"]},
-    "reid": {"name": "Thomas Reid", "category": "Modern", "sep": "https://plato.stanford.edu/entries/reid/", "deps": ["hume", "locke"], "keywords": ["Reid"]},
+    "rousseau": {"name": "Jean-Jacques Rousseau", "category": "Modern", "sep": "https://plato.stanford.edu/entries/rousseau/", "deps": ["hobbes", "locke"], "keywords": ["Rousseau"], "aliases": ["Rousseau"]},
+    "kant": {"name": "Immanuel Kant", "category": "Modern", "sep": "https://plato.stanford.edu/entries/kant/", "deps": ["hume", "leibniz", "rousseau"], "keywords": ["Kant", "Critique"], "aliases": ["Kant"]},
+    "burke": {"name": "Edmund Burke", "category": "Modern", "sep": "https://plato.stanford.edu/entries/burke/", "deps": ["locke"], "keywords": ["Burke"], "aliases": ["Burke"]},
+    "reid": {"name": "Thomas Reid", "category": "Modern", "sep": "https://plato.stanford.edu/entries/reid/", "deps": ["hume", "locke"], "keywords": ["Reid"], "aliases": ["Reid"]},
 
     # --- 19th Century ---
-    "hegel": {"name": "G.W.F. Hegel", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/hegel/", "deps": ["kant", "fichte", "schelling"], "keywords": ["Hegel", "Phenomenology"]},
-    "fichte": {"name": "J.G. Fichte", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/johann-fichte/", "deps": ["kant"], "keywords": ["Fichte"]},
-    "schelling": {"name": "F.W.J. Schelling", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/schelling/", "deps": ["kant", "fichte", "spinoza"], "keywords": ["Schelling"]},
-    "schopenhauer": {"name": "Arthur Schopenhauer", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/schopenhauer/", "deps": ["kant", "plato"], "keywords": ["Schopenhauer"]},
-    "kierkegaard": {"name": "Søren Kierkegaard", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/kierkegaard/", "deps": ["hegel", "socrates"], "keywords": ["Kierkegaard", "Fear and Trembling", "Sickness Unto Death", "Either/Or"]},
-    "marx": {"name": "Karl Marx", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/marx/", "deps": ["hegel", "feuerbach", "smith"], "keywords": ["Marx", "Communist", "Capital"]},
-    "stirner": {"name": "Max Stirner", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/max-stirner/", "deps": ["hegel", "feuerbach"], "keywords": ["Stirner"]},
-    "feuerbach": {"name": "Ludwig Feuerbach", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/ludwig-feuerbach/", "deps": ["hegel"], "keywords": ["Feuerbach"]},
-    "nietzsche": {"name": "Friedrich Nietzsche", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/nietzsche/", "deps": ["schopenhauer", "wagner", "presocratics"], "keywords": ["Nietzsche", "Zarathustra", "Beyond Good and Evil", "Gay Science"]},
-    "mill": {"name": "J.S. Mill", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/mill/", "deps": ["bentham", "aristotle"], "keywords": ["Mill", "Utilitarianism"]},
-    "bentham": {"name": "Jeremy Bentham", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/bentham/", "deps": ["hume"], "keywords": ["Bentham"]},
-    "emerson": {"name": "Ralph Waldo Emerson", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/emerson/", "deps": ["plato", "kant"], "keywords": ["Emerson", "Oversoul"]},
-    "thoreau": {"name": "Henry David Thoreau", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/thoreau/", "deps": ["emerson"], "keywords": ["Thoreau"]},
+    "hegel": {"name": "G.W.F. Hegel", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/hegel/", "deps": ["kant", "fichte", "schelling"], "keywords": ["Hegel", "Phenomenology"], "aliases": ["Hegel"]},
+    "fichte": {"name": "J.G. Fichte", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/johann-fichte/", "deps": ["kant"], "keywords": ["Fichte"], "aliases": ["Fichte"]},
+    "schelling": {"name": "F.W.J. Schelling", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/schelling/", "deps": ["kant", "fichte", "spinoza"], "keywords": ["Schelling"], "aliases": ["Schelling"]},
+    "schopenhauer": {"name": "Arthur Schopenhauer", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/schopenhauer/", "deps": ["kant", "plato"], "keywords": ["Schopenhauer"], "aliases": ["Schopenhauer"]},
+    "kierkegaard": {"name": "Søren Kierkegaard", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/kierkegaard/", "deps": ["hegel", "socrates"], "keywords": ["Kierkegaard", "Fear and Trembling", "Sickness Unto Death", "Either/Or"], "aliases": ["Kierkegaard"]},
+    "marx": {"name": "Karl Marx", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/marx/", "deps": ["hegel", "feuerbach", "smith"], "keywords": ["Marx", "Communist", "Capital"], "aliases": ["Marx"]},
+    "stirner": {"name": "Max Stirner", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/max-stirner/", "deps": ["hegel", "feuerbach"], "keywords": ["Stirner"], "aliases": ["Stirner"]},
+    "feuerbach": {"name": "Ludwig Feuerbach", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/ludwig-feuerbach/", "deps": ["hegel"], "keywords": ["Feuerbach"], "aliases": ["Feuerbach"]},
+    "nietzsche": {"name": "Friedrich Nietzsche", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/nietzsche/", "deps": ["schopenhauer", "wagner", "presocratics"], "keywords": ["Nietzsche", "Zarathustra", "Beyond Good and Evil", "Gay Science"], "aliases": ["Nietzsche"]},
+    "mill": {"name": "J.S. Mill", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/mill/", "deps": ["bentham", "aristotle"], "keywords": ["Mill", "Utilitarianism"], "aliases": ["Mill"]},
+    "bentham": {"name": "Jeremy Bentham", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/bentham/", "deps": ["hume"], "keywords": ["Bentham"], "aliases": ["Bentham"]},
+    "emerson": {"name": "Ralph Waldo Emerson", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/emerson/", "deps": ["plato", "kant"], "keywords": ["Emerson", "Oversoul"], "aliases": ["Emerson"]},
+    "thoreau": {"name": "Henry David Thoreau", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/thoreau/", "deps": ["emerson"], "keywords": ["Thoreau"], "aliases": ["Thoreau"]},
 
     # --- 20th Century / Continental ---
-    "husserl": {"name": "Edmund Husserl", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/husserl/", "deps": ["brentano", "descartes", "kant"], "keywords": ["Husserl"]},
-    "heidegger": {"name": "Martin Heidegger", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/heidegger/", "deps": ["husserl", "aristotle", "nietzsche"], "keywords": ["Heidegger", "Being and Time"]},
-    "sartre": {"name": "Jean-Paul Sartre", "category": "Existentialism", "sep": "https://plato.stanford.edu/entries/sartre/", "deps": ["heidegger", "husserl", "kierkegaard", "marx"], "keywords": ["Sartre", "No Exit", "Being and Nothingness"]},
-    "camus": {"name": "Albert Camus", "category": "Existentialism", "sep": "https://plato.stanford.edu/entries/camus/", "deps": ["sartre", "nietzsche"], "keywords": ["Camus", "The Stranger", "Myth of Sisyphus"]},
-    "beauvoir": {"name": "Simone de Beauvoir", "category": "Existentialism", "sep": "https://plato.stanford.edu/entries/beauvoir/", "deps": ["sartre", "hegel"], "keywords": ["Beauvoir", "Second Sex"]},
-    "merleau_ponty": {"name": "Maurice Merleau-Ponty", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/merleau-ponty/", "deps": ["husserl", "heidegger"], "keywords": ["Merleau-Ponty"]},
-    "levinas": {"name": "Emmanuel Levinas", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/levinas/", "deps": ["husserl", "heidegger"], "keywords": ["Levinas"]},
-    "arendt": {"name": "Hannah Arendt", "category": "Political Phil", "sep": "https://plato.stanford.edu/entries/arendt/", "deps": ["heidegger", "jaspers", "kant"], "keywords": ["Arendt"]},
-    "foucault": {"name": "Michel Foucault", "category": "Post-Structuralism", "sep": "https://plato.stanford.edu/entries/foucault/", "deps": ["nietzsche", "heidegger", "marx"], "keywords": ["Foucault"]},
-    "derrida": {"name": "Jacques Derrida", "category": "Post-Structuralism", "sep": "https://plato.stanford.edu/entries/derrida/", "deps": ["heidegger", "husserl", "saussure"], "keywords": ["Derrida"]},
-    "deleuze": {"name": "Gilles Deleuze", "category": "Post-Structuralism", "sep": "https://plato.stanford.edu/entries/deleuze/", "deps": ["nietzsche", "spinoza", "bergson"], "keywords": ["Deleuze"]},
-    "badiou": {"name": "Alain Badiou", "category": "Continental", "sep": "https://plato.stanford.edu/entries/badiou/", "deps": ["sartre", "lacan", "marx"], "keywords": ["Badiou"]},
-    "lacan": {"name": "Jacques Lacan", "category": "Psychoanalysis", "sep": "https://plato.stanford.edu/entries/lacan/", "deps": ["freud", "hegel"], "keywords": ["Lacan"]},
-    "habermas": {"name": "Jürgen Habermas", "category": "Critical Theory", "sep": "https://plato.stanford.edu/entries/habermas/", "deps": ["adorno", "horkheimer", "kant"], "keywords": ["Habermas"]},
-    "adorno_horkheimer": {"name": "Adorno & Horkheimer", "category": "Critical Theory", "sep": "https://plato.stanford.edu/entries/critical-theory/", "deps": ["marx", "kant", "hegel", "freud"], "keywords": ["Adorno", "Horkheimer", "Dialectic of Enlightenment"]},
+    "husserl": {"name": "Edmund Husserl", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/husserl/", "deps": ["brentano", "descartes", "kant"], "keywords": ["Husserl"], "aliases": ["Husserl"]},
+    "heidegger": {"name": "Martin Heidegger", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/heidegger/", "deps": ["husserl", "aristotle", "nietzsche"], "keywords": ["Heidegger", "Being and Time"], "aliases": ["Heidegger"]},
+    "sartre": {"name": "Jean-Paul Sartre", "category": "Existentialism", "sep": "https://plato.stanford.edu/entries/sartre/", "deps": ["heidegger", "husserl", "kierkegaard", "marx"], "keywords": ["Sartre", "No Exit", "Being and Nothingness"], "aliases": ["Sartre"]},
+    "camus": {"name": "Albert Camus", "category": "Existentialism", "sep": "https://plato.stanford.edu/entries/camus/", "deps": ["sartre", "nietzsche"], "keywords": ["Camus", "The Stranger", "Myth of Sisyphus"], "aliases": ["Camus"]},
+    "beauvoir": {"name": "Simone de Beauvoir", "category": "Existentialism", "sep": "https://plato.stanford.edu/entries/beauvoir/", "deps": ["sartre", "hegel"], "keywords": ["Beauvoir", "Second Sex"], "aliases": ["Beauvoir"]},
+    "merleau_ponty": {"name": "Maurice Merleau-Ponty", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/merleau-ponty/", "deps": ["husserl", "heidegger"], "keywords": ["Merleau-Ponty"], "aliases": ["Merleau-Ponty"]},
+    "levinas": {"name": "Emmanuel Levinas", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/levinas/", "deps": ["husserl", "heidegger"], "keywords": ["Levinas"], "aliases": ["Levinas"]},
+    "arendt": {"name": "Hannah Arendt", "category": "Political Phil", "sep": "https://plato.stanford.edu/entries/arendt/", "deps": ["heidegger", "jaspers", "kant"], "keywords": ["Arendt"], "aliases": ["Arendt"]},
+    "foucault": {"name": "Michel Foucault", "category": "Post-Structuralism", "sep": "https://plato.stanford.edu/entries/foucault/", "deps": ["nietzsche", "heidegger", "marx"], "keywords": ["Foucault"], "aliases": ["Foucault"]},
+    "derrida": {"name": "Jacques Derrida", "category": "Post-Structuralism", "sep": "https://plato.stanford.edu/entries/derrida/", "deps": ["heidegger", "husserl", "saussure"], "keywords": ["Derrida"], "aliases": ["Derrida"]},
+    "deleuze": {"name": "Gilles Deleuze", "category": "Post-Structuralism", "sep": "https://plato.stanford.edu/entries/deleuze/", "deps": ["nietzsche", "spinoza", "bergson"], "keywords": ["Deleuze"], "aliases": ["Deleuze"]},
+    "badiou": {"name": "Alain Badiou", "category": "Continental", "sep": "https://plato.stanford.edu/entries/badiou/", "deps": ["sartre", "lacan", "marx"], "keywords": ["Badiou"], "aliases": ["Badiou"]},
+    "lacan": {"name": "Jacques Lacan", "category": "Psychoanalysis", "sep": "https://plato.stanford.edu/entries/lacan/", "deps": ["freud", "hegel"], "keywords": ["Lacan"], "aliases": ["Lacan"]},
+    "habermas": {"name": "Jürgen Habermas", "category": "Critical Theory", "sep": "https://plato.stanford.edu/entries/habermas/", "deps": ["adorno", "horkheimer", "kant"], "keywords": ["Habermas"], "aliases": ["Habermas"]},
+    "adorno_horkheimer": {"name": "Adorno & Horkheimer", "category": "Critical Theory", "sep": "https://plato.stanford.edu/entries/critical-theory/", "deps": ["marx", "kant", "hegel", "freud"], "keywords": ["Adorno", "Horkheimer", "Dialectic of Enlightenment"], "aliases": ["Adorno", "Horkheimer"]},
 
     # --- Analytic / Pragmatism ---
-    "frege": {"name": "Gottlob Frege", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/frege/", "deps": ["kant", "leibniz"], "keywords": ["Frege"]},
-    "russell": {"name": "Bertrand Russell", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/russell/", "deps": ["leibniz", "frege", "moore"], "keywords": ["Russell"]},
-    "wittgenstein": {"name": "Ludwig Wittgenstein", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/wittgenstein/", "deps": ["frege", "russell"], "keywords": ["Wittgenstein", "Tractatus", "Philosophical Investigations", "On Certainty"]},
+    "frege": {"name": "Gottlob Frege", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/frege/", "deps": ["kant", "leibniz"], "keywords": ["Frege"], "aliases": ["Frege"]},
+    "russell": {"name": "Bertrand Russell", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/russell/", "deps": ["leibniz", "frege", "moore"], "keywords": ["Russell"], "aliases": ["Russell"]},
+    "wittgenstein": {"name": "Ludwig Wittgenstein", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/wittgenstein/", "deps": ["frege", "russell"], "keywords": ["Wittgenstein", "Tractatus", "Philosophical Investigations", "On Certainty"], "aliases": ["Wittgenstein"]},
     "moore": {"name": "G.E. Moore", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/moore/", "deps": [], "keywords": ["G.E. Moore", "Common Sense"]},
-    "quine": {"name": "W.V.O. Quine", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/quine/", "deps": ["carnap", "russell"], "keywords": ["Quine"]},
-    "kuhn": {"name": "Thomas Kuhn", "category": "Phil of Science", "sep": "https://plato.stanford.edu/entries/thomas-kuhn/", "deps": ["popper"], "keywords": ["Kuhn", "Scientific Revolutions"]},
-    "popper": {"name": "Karl Popper", "category": "Phil of Science", "sep": "https://plato.stanford.edu/entries/popper/", "deps": ["hume", "kant"], "keywords": ["Popper"]},
-    "lakatos": {"name": "Imre Lakatos", "category": "Phil of Science", "sep": "https://plato.stanford.edu/entries/lakatos/", "deps": ["popper", "kuhn"], "keywords": ["Lakatos"]},
-    "feyerabend": {"name": "Paul Feyerabend", "category": "Phil of Science", "sep": "https://plato.stanford.edu/entries/feyerabend/", "deps": ["kuhn", "lakatos"], "keywords": ["Feyerabend", "Against Method"]},
+    "quine": {"name": "W.V.O. Quine", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/quine/", "deps": ["carnap", "russell"], "keywords": ["Quine"], "aliases": ["Quine"]},
+    "kuhn": {"name": "Thomas Kuhn", "category": "Phil of Science", "sep": "https://plato.stanford.edu/entries/thomas-kuhn/", "deps": ["popper"], "keywords": ["Kuhn", "Scientific Revolutions"], "aliases": ["Kuhn"]},
+    "popper": {"name": "Karl Popper", "category": "Phil of Science", "sep": "https://plato.stanford.edu/entries/popper/", "deps": ["hume", "kant"], "keywords": ["Popper"], "aliases": ["Popper"]},
+    "lakatos": {"name": "Imre Lakatos", "category": "Phil of Science", "sep": "https://plato.stanford.edu/entries/lakatos/", "deps": ["popper", "kuhn"], "keywords": ["Lakatos"], "aliases": ["Lakatos"]},
+    "feyerabend": {"name": "Paul Feyerabend", "category": "Phil of Science", "sep": "https://plato.stanford.edu/entries/feyerabend/", "deps": ["kuhn", "lakatos"], "keywords": ["Feyerabend", "Against Method"], "aliases": ["Feyerabend"]},
     "james": {"name": "William James", "category": "Pragmatism", "sep": "https://plato.stanford.edu/entries/james/", "deps": ["peirce", "mill"], "keywords": ["William James", "Pragmatism"]},
-    "dewey": {"name": "John Dewey", "category": "Pragmatism", "sep": "https://plato.stanford.edu/entries/dewey/", "deps": ["james", "hegel"], "keywords": ["Dewey"]},
-    "rorty": {"name": "Richard Rorty", "category": "Pragmatism", "sep": "https://plato.stanford.edu/entries/rorty/", "deps": ["dewey", "wittgenstein", "heidegger"], "keywords": ["Rorty"]},
-    "rawls": {"name": "John Rawls", "category": "Political Phil", "sep": "https://plato.stanford.edu/entries/rawls/", "deps": ["kant", "locke", "rousseau"], "keywords": ["Rawls", "Theory of Justice"]},
-    "nozick": {"name": "Robert Nozick", "category": "Political Phil", "sep": "https://plato.stanford.edu/entries/nozick-political/", "deps": ["locke", "rawls"], "keywords": ["Nozick", "Anarchy"]},
-    "parfit": {"name": "Derek Parfit", "category": "Ethics", "sep": "https://plato.stanford.edu/entries/parfit/", "deps": ["sidgwick", "kant"], "keywords": ["Parfit"]},
+    "dewey": {"name": "John Dewey", "category": "Pragmatism", "sep": "https://plato.stanford.edu/entries/dewey/", "deps": ["james", "hegel"], "keywords": ["Dewey"], "aliases": ["Dewey"]},
+    "rorty": {"name": "Richard Rorty", "category": "Pragmatism", "sep": "https://plato.stanford.edu/entries/rorty/", "deps": ["dewey", "wittgenstein", "heidegger"], "keywords": ["Rorty"], "aliases": ["Rorty"]},
+    "rawls": {"name": "John Rawls", "category": "Political Phil", "sep": "https://plato.stanford.edu/entries/rawls/", "deps": ["kant", "locke", "rousseau"], "keywords": ["Rawls", "Theory of Justice"], "aliases": ["Rawls"]},
+    "nozick": {"name": "Robert Nozick", "category": "Political Phil", "sep": "https://plato.stanford.edu/entries/nozick-political/", "deps": ["locke", "rawls"], "keywords": ["Nozick", "Anarchy"], "aliases": ["Nozick"]},
+    "parfit": {"name": "Derek Parfit", "category": "Ethics", "sep": "https://plato.stanford.edu/entries/parfit/", "deps": ["sidgwick", "kant"], "keywords": ["Parfit"], "aliases": ["Parfit"]},
     "foot": {"name": "Philippa Foot", "category": "Ethics", "sep": "https://plato.stanford.edu/entries/foot-philippa/", "deps": ["aristotle", "aquinas"], "keywords": ["Philippa Foot"]},
-    "korsgaard": {"name": "Christine Korsgaard", "category": "Ethics", "sep": "https://plato.stanford.edu/entries/kant-moral/", "deps": ["kant", "rawls"], "keywords": ["Korsgaard"]},
-    "railton": {"name": "Peter Railton", "category": "Ethics", "sep": "https://plato.stanford.edu/entries/naturalism-moral/", "deps": ["hume"], "keywords": ["Railton", "Moral Realism"]},
-    "williamson": {"name": "Timothy Williamson", "category": "Analytic", "sep": "", "deps": [], "keywords": ["Williamson"]},
-    "chalmers": {"name": "David Chalmers", "category": "Phil of Mind", "sep": "https://plato.stanford.edu/entries/chalmers/", "deps": ["descartes"], "keywords": ["Chalmers"]},
-    "dennett": {"name": "Daniel Dennett", "category": "Phil of Mind", "sep": "https://plato.stanford.edu/entries/dennett/", "deps": ["quine", "ryle"], "keywords": ["Dennett"]},
-    "searle": {"name": "John Searle", "category": "Phil of Mind", "sep": "https://plato.stanford.edu/entries/searle/", "deps": ["austin"], "keywords": ["Searle"]},
+    "korsgaard": {"name": "Christine Korsgaard", "category": "Ethics", "sep": "https://plato.stanford.edu/entries/kant-moral/", "deps": ["kant", "rawls"], "keywords": ["Korsgaard"], "aliases": ["Korsgaard"]},
+    "railton": {"name": "Peter Railton", "category": "Ethics", "sep": "https://plato.stanford.edu/entries/naturalism-moral/", "deps": ["hume"], "keywords": ["Railton", "Moral Realism"], "aliases": ["Railton"]},
+    "williamson": {"name": "Timothy Williamson", "category": "Analytic", "sep": "", "deps": [], "keywords": ["Williamson"], "aliases": ["Williamson"]},
+    "chalmers": {"name": "David Chalmers", "category": "Phil of Mind", "sep": "https://plato.stanford.edu/entries/chalmers/", "deps": ["descartes"], "keywords": ["Chalmers"], "aliases": ["Chalmers"]},
+    "dennett": {"name": "Daniel Dennett", "category": "Phil of Mind", "sep": "https://plato.stanford.edu/entries/dennett/", "deps": ["quine", "ryle"], "keywords": ["Dennett"], "aliases": ["Dennett"]},
+    "searle": {"name": "John Searle", "category": "Phil of Mind", "sep": "https://plato.stanford.edu/entries/searle/", "deps": ["austin"], "keywords": ["Searle"], "aliases": ["Searle"]},
 
     # --- Eastern ---
     "confucius": {"name": "Confucius", "category": "Eastern", "sep": "https://plato.stanford.edu/entries/confucius/", "deps": [], "keywords": ["Confucius", "Analects"]},
-    "mencius": {"name": "Mengzi (Mencius)", "category": "Eastern", "sep": "https://plato.stanford.edu/entries/mencius/", "deps": ["confucius"], "keywords": ["Mengzi", "Mencius"]},
+    "mencius": {"name": "Mengzi (Mencius)", "category": "Eastern", "sep": "https://plato.stanford.edu/entries/mencius/", "deps": ["confucius"], "keywords": ["Mengzi", "Mencius"], "aliases": ["Mengzi", "Mencius"]},
     "mozi": {"name": "Mozi", "category": "Eastern", "sep": "https://plato.stanford.edu/entries/mohism/", "deps": ["confucius"], "keywords": ["Mozi", "Mohism"]},
     "laozi": {"name": "Laozi", "category": "Eastern", "sep": "https://plato.stanford.edu/entries/laozi/", "deps": [], "keywords": ["Laozi", "Dao De Jing", "Daodejing", "Dao"]},
     "zhuangzi": {"name": "Zhuangzi", "category": "Eastern", "sep": "https://plato.stanford.edu/entries/zhuangzi/", "deps": ["laozi"], "keywords": ["Zhuangzi"]},
@@ -112,38 +150,38 @@ KNOWLEDGE_BASE = {
     "liberalism": {"name": "Liberalism", "category": "Topic", "sep": "https://plato.stanford.edu/entries/liberalism/", "deps": ["locke", "mill", "rawls"], "keywords": ["Liberalism"]},
     "abortion": {"name": "Abortion Ethics", "category": "Topic", "sep": "https://plato.stanford.edu/entries/abortion/", "deps": ["foot", "thomson"], "keywords": ["Abortion"]},
     "terrorism": {"name": "Terrorism", "category": "Topic", "sep": "https://plato.stanford.edu/entries/terrorism/", "deps": [], "keywords": ["Terrorism"]},
-    "freud": {"name": "Sigmund Freud", "category": "Psychoanalysis", "sep": "https://plato.stanford.edu/entries/freud/", "deps": ["nietzsche"], "keywords": ["Freud"]},
-    "jung": {"name": "Carl Jung", "category": "Psychoanalysis", "sep": "", "deps": ["freud"], "keywords": ["Jung"]},
-    "brentano": {"name": "Franz Brentano", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/brentano/", "deps": ["aristotle"], "keywords": ["Brentano"]},
+    "freud": {"name": "Sigmund Freud", "category": "Psychoanalysis", "sep": "https://plato.stanford.edu/entries/freud/", "deps": ["nietzsche"], "keywords": ["Freud"], "aliases": ["Freud"]},
+    "jung": {"name": "Carl Jung", "category": "Psychoanalysis", "sep": "", "deps": ["freud"], "keywords": ["Jung"], "aliases": ["Jung"]},
+    "brentano": {"name": "Franz Brentano", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/brentano/", "deps": ["aristotle"], "keywords": ["Brentano"], "aliases": ["Brentano"]},
     "stein": {"name": "Edith Stein", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/stein/", "deps": ["husserl"], "keywords": ["Edith Stein"]},
-    "scheler": {"name": "Max Scheler", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/scheler/", "deps": ["husserl", "nietzsche"], "keywords": ["Scheler"]},
-    "buber": {"name": "Martin Buber", "category": "Existentialism", "sep": "https://plato.stanford.edu/entries/buber/", "deps": ["kierkegaard"], "keywords": ["Buber", "I and Thou"]},
+    "scheler": {"name": "Max Scheler", "category": "Phenomenology", "sep": "https://plato.stanford.edu/entries/scheler/", "deps": ["husserl", "nietzsche"], "keywords": ["Scheler"], "aliases": ["Scheler"]},
+    "buber": {"name": "Martin Buber", "category": "Existentialism", "sep": "https://plato.stanford.edu/entries/buber/", "deps": ["kierkegaard"], "keywords": ["Buber", "I and Thou"], "aliases": ["Buber"]},
     "weil": {"name": "Simone Weil", "category": "Modern", "sep": "https://plato.stanford.edu/entries/simone-weil/", "deps": ["plato", "marx", "kant"], "keywords": ["Simone Weil"]},
-    "cioran": {"name": "Emil Cioran", "category": "Existentialism", "sep": "", "deps": ["nietzsche", "schopenhauer"], "keywords": ["Cioran"]},
-    "tomasello": {"name": "Michael Tomasello", "category": "Phil of Mind", "sep": "", "deps": [], "keywords": ["Tomasello"]},
-    "haraway": {"name": "Donna Haraway", "category": "Feminist Phil", "sep": "https://plato.stanford.edu/entries/feminist-science/", "deps": ["foucault"], "keywords": ["Haraway"]},
-    "irigaray": {"name": "Luce Irigaray", "category": "Feminist Phil", "sep": "https://plato.stanford.edu/entries/irigaray/", "deps": ["lacan", "derrida", "beauvoir"], "keywords": ["Irigaray"]},
+    "cioran": {"name": "Emil Cioran", "category": "Existentialism", "sep": "", "deps": ["nietzsche", "schopenhauer"], "keywords": ["Cioran"], "aliases": ["Cioran"]},
+    "tomasello": {"name": "Michael Tomasello", "category": "Phil of Mind", "sep": "", "deps": [], "keywords": ["Tomasello"], "aliases": ["Tomasello"]},
+    "haraway": {"name": "Donna Haraway", "category": "Feminist Phil", "sep": "https://plato.stanford.edu/entries/feminist-science/", "deps": ["foucault"], "keywords": ["Haraway"], "aliases": ["Haraway"]},
+    "irigaray": {"name": "Luce Irigaray", "category": "Feminist Phil", "sep": "https://plato.stanford.edu/entries/irigaray/", "deps": ["lacan", "derrida", "beauvoir"], "keywords": ["Irigaray"], "aliases": ["Irigaray"]},
     "butler": {"name": "Judith Butler", "category": "Feminist Phil", "sep": "https://plato.stanford.edu/entries/feminist-body/", "deps": ["foucault", "derrida"], "keywords": ["Judith Butler"]},
-    "scruton": {"name": "Roger Scruton", "category": "Aesthetics", "sep": "https://plato.stanford.edu/entries/aesthetic-judgment/", "deps": ["kant", "burke"], "keywords": ["Scruton"]},
-    "langer": {"name": "Susanne Langer", "category": "Aesthetics", "sep": "https://plato.stanford.edu/entries/langer/", "deps": ["cassirer", "whitehead"], "keywords": ["Langer"]},
-    "cassirer": {"name": "Ernst Cassirer", "category": "Neo-Kantian", "sep": "https://plato.stanford.edu/entries/cassirer/", "deps": ["kant"], "keywords": ["Cassirer"]},
-    "dostoevsky": {"name": "Fyodor Dostoevsky", "category": "Literature", "sep": "https://plato.stanford.edu/entries/dostoevsky/", "deps": ["existentialism"], "keywords": ["Dostoevsky", "Brothers Karamazov"]},
-    "shakespeare": {"name": "William Shakespeare", "category": "Literature", "sep": "", "deps": [], "keywords": ["Shakespeare", "Timon of Athens"]},
+    "scruton": {"name": "Roger Scruton", "category": "Aesthetics", "sep": "https://plato.stanford.edu/entries/aesthetic-judgment/", "deps": ["kant", "burke"], "keywords": ["Scruton"], "aliases": ["Scruton"]},
+    "langer": {"name": "Susanne Langer", "category": "Aesthetics", "sep": "https://plato.stanford.edu/entries/langer/", "deps": ["cassirer", "whitehead"], "keywords": ["Langer"], "aliases": ["Langer"]},
+    "cassirer": {"name": "Ernst Cassirer", "category": "Neo-Kantian", "sep": "https://plato.stanford.edu/entries/cassirer/", "deps": ["kant"], "keywords": ["Cassirer"], "aliases": ["Cassirer"]},
+    "dostoevsky": {"name": "Fyodor Dostoevsky", "category": "Literature", "sep": "https://plato.stanford.edu/entries/dostoevsky/", "deps": ["existentialism"], "keywords": ["Dostoevsky", "Brothers Karamazov"], "aliases": ["Dostoevsky"]},
+    "shakespeare": {"name": "William Shakespeare", "category": "Literature", "sep": "", "deps": [], "keywords": ["Shakespeare", "Timon of Athens"], "aliases": ["Shakespeare"]},
     "mccarthy": {"name": "Cormac McCarthy", "category": "Literature", "sep": "", "deps": [], "keywords": ["Cormac McCarthy", "Blood Meridian"]},
-    "thoreau": {"name": "Henry David Thoreau", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/thoreau/", "deps": ["emerson"], "keywords": ["Thoreau"]},
-    "royce": {"name": "Josiah Royce", "category": "Pragmatism", "sep": "https://plato.stanford.edu/entries/royce/", "deps": ["hegel", "james"], "keywords": ["Royce"]},
-    "grice": {"name": "Paul Grice", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/grice/", "deps": ["austin", "wittgenstein"], "keywords": ["Grice"]},
+    "thoreau": {"name": "Henry David Thoreau", "category": "19th Century", "sep": "https://plato.stanford.edu/entries/thoreau/", "deps": ["emerson"], "keywords": ["Thoreau"], "aliases": ["Thoreau"]},
+    "royce": {"name": "Josiah Royce", "category": "Pragmatism", "sep": "https://plato.stanford.edu/entries/royce/", "deps": ["hegel", "james"], "keywords": ["Royce"], "aliases": ["Royce"]},
+    "grice": {"name": "Paul Grice", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/grice/", "deps": ["austin", "wittgenstein"], "keywords": ["Grice"], "aliases": ["Grice"]},
     "austin": {"name": "J.L. Austin", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/austin/", "deps": [], "keywords": ["J.L. Austin"]},
     "strawson": {"name": "P.F. Strawson", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/strawson/", "deps": ["kant", "wittgenstein"], "keywords": ["P.F. Strawson"]},
     "frankfurt": {"name": "Harry Frankfurt", "category": "Analytic", "sep": "https://plato.stanford.edu/entries/compatibilism/", "deps": [], "keywords": ["Harry Frankfurt", "Bullshit"]},
-    "bergson": {"name": "Henri Bergson", "category": "Process Phil", "sep": "https://plato.stanford.edu/entries/bergson/", "deps": [], "keywords": ["Bergson"]},
-    "whitehead": {"name": "Alfred North Whitehead", "category": "Process Phil", "sep": "https://plato.stanford.edu/entries/whitehead/", "deps": [], "keywords": ["Whitehead"]},
-    "santayana": {"name": "George Santayana", "category": "Naturalism", "sep": "https://plato.stanford.edu/entries/santayana/", "deps": ["spinoza", "james"], "keywords": ["Santayana"]},
+    "bergson": {"name": "Henri Bergson", "category": "Process Phil", "sep": "https://plato.stanford.edu/entries/bergson/", "deps": [], "keywords": ["Bergson"], "aliases": ["Bergson"]},
+    "whitehead": {"name": "Alfred North Whitehead", "category": "Process Phil", "sep": "https://plato.stanford.edu/entries/whitehead/", "deps": [], "keywords": ["Whitehead"], "aliases": ["Whitehead"]},
+    "santayana": {"name": "George Santayana", "category": "Naturalism", "sep": "https://plato.stanford.edu/entries/santayana/", "deps": ["spinoza", "james"], "keywords": ["Santayana"], "aliases": ["Santayana"]},
     "mounk": {"name": "Yascha Mounk", "category": "Political Phil", "sep": "", "deps": ["liberalism"], "keywords": ["Yascha Mounk", "Identity Trap"]},
-    "sandel": {"name": "Michael Sandel", "category": "Political Phil", "sep": "https://plato.stanford.edu/entries/communitarianism/", "deps": ["rawls", "aristotle"], "keywords": ["Sandel"]},
-    "badiou": {"name": "Alain Badiou", "category": "Continental", "sep": "https://plato.stanford.edu/entries/badiou/", "deps": ["sartre", "lacan", "marx"], "keywords": ["Badiou"]},
-    "agamben": {"name": "Giorgio Agamben", "category": "Continental", "sep": "", "deps": ["heidegger", "benjamin"], "keywords": ["Agamben"]},
-    "benjamin": {"name": "Walter Benjamin", "category": "Critical Theory", "sep": "https://plato.stanford.edu/entries/benjamin/", "deps": ["marx"], "keywords": ["Benjamin"]},
+    "sandel": {"name": "Michael Sandel", "category": "Political Phil", "sep": "https://plato.stanford.edu/entries/communitarianism/", "deps": ["rawls", "aristotle"], "keywords": ["Sandel"], "aliases": ["Sandel"]},
+    "badiou": {"name": "Alain Badiou", "category": "Continental", "sep": "https://plato.stanford.edu/entries/badiou/", "deps": ["sartre", "lacan", "marx"], "keywords": ["Badiou"], "aliases": ["Badiou"]},
+    "agamben": {"name": "Giorgio Agamben", "category": "Continental", "sep": "", "deps": ["heidegger", "benjamin"], "keywords": ["Agamben"], "aliases": ["Agamben"]},
+    "benjamin": {"name": "Walter Benjamin", "category": "Critical Theory", "sep": "https://plato.stanford.edu/entries/benjamin/", "deps": ["marx"], "keywords": ["Benjamin"], "aliases": ["Benjamin"]},
 }
 
 # --- PHASE 2: GENERIC BUCKETS ---
@@ -159,46 +197,605 @@ TOPIC_BUCKETS = {
 def normalize(text):
     return text.lower() if text else ""
 
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a {key: {"keywords": [...]}} table, built once.
+    A title is scanned in a single pass regardless of how many keywords there are;
+    the winner is the earliest entry in dict order and, within it, the earliest
+    keyword in list order, same as the old nested loops.
+    """
+
+    def __init__(self, entries):
+        self.goto = [{}]     # state -> {char: next state}
+        self.fail = [0]
+        self.outputs = [()]  # state -> hits ending here, as (priority, keyword index, key, keyword)
+
+        for priority, (key, info) in enumerate(entries.items()):
+            for index, keyword in enumerate(info.get('keywords', [])):
+                kw = normalize(keyword)
+                if not kw:
+                    continue
+                state = 0
+                for ch in kw:
+                    nxt = self.goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(self.goto)
+                        self.goto.append({})
+                        self.fail.append(0)
+                        self.outputs.append(())
+                        self.goto[state][ch] = nxt
+                    state = nxt
+                self.outputs[state] += ((priority, index, key, keyword),)
+
+        # Breadth-first pass: fail links, and fold each state's suffix outputs into it
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0) if state else 0
+                self.outputs[nxt] += self.outputs[self.fail[nxt]]
+
+        self.best = [min(out) if out else None for out in self.outputs]
+
+    def _states(self, title):
+        goto, fail = self.goto, self.fail
+        state = 0
+        for ch in normalize(title):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            yield state
+
+    def hits(self, title):
+        """All (key, keyword) pairs found in the title, in priority order."""
+        found = set()
+        for state in self._states(title):
+            found.update(self.outputs[state])
+        return [(key, keyword) for _, _, key, keyword in sorted(found)]
+
+    def find(self, title):
+        """Highest-priority (key, keyword) hit, or None."""
+        best = None
+        for state in self._states(title):
+            hit = self.best[state]
+            if hit is not None and (best is None or hit < best):
+                best = hit
+        return (best[2], best[3]) if best else None
+
+    def match(self, title):
+        """Key of the highest-priority entry whose keyword appears in the title."""
+        hit = self.find(title)
+        return hit[0] if hit else None
+
+ITUNES_NS = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+
+def _child_text(item, tag, default=None):
+    child = item.find(tag)
+    if child is None or child.text is None:
+        return default
+    return child.text.strip()
+
+def _parse_pub_date(value):
+    """Converts an RFC 822 pubDate to ISO 8601, keeping the raw string if it won't parse."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).isoformat()
+    except (TypeError, ValueError):
+        return value
+
+def _episode_from_item(item):
+    enclosure = item.find('enclosure')
+    length = enclosure.get('length') if enclosure is not None else None
+    return {
+        'title': _child_text(item, 'title', "No Title"),
+        'link': _child_text(item, 'link', MISSING_LINK),
+        'guid': _child_text(item, 'guid'),
+        'pub_date': _parse_pub_date(_child_text(item, 'pubDate')),
+        'enclosure_url': enclosure.get('url') if enclosure is not None else None,
+        'enclosure_length': int(length) if length and length.isdigit() else None,
+        'duration': _child_text(item, ITUNES_NS + 'duration'),
+    }
+
+def iter_rss_feed(source):
+    """
+    Streams episodes out of an RSS file (path or file object) one <item> at a time.
+    Finished items are cleared and detached so memory stays flat on large feeds.
+    """
+    parents = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag == 'item':
+            yield _episode_from_item(elem)
+            elem.clear()
+            if parents:
+                parents[-1].remove(elem)
+
 def parse_rss_feed(filename):
-    """Parses the RSS XML and extracts episodes."""
+    """Parses the RSS XML and extracts episodes into an EpisodeTable."""
     try:
-        tree = ET.parse(filename)
-        root = tree.getroot()
+        episodes = EpisodeTable(iter_rss_feed(filename))
     except Exception as e:
         print(f"Error parsing XML: {e}")
-        return []
+        return EpisodeTable()
 
-    episodes = []
-    items = root.findall('.//item')
-    print(f"Found {len(items)} items in XML.")
-
-    for item in items:
-        title = item.find('title').text if item.find('title') is not None else "No Title"
-        link = item.find('link').text if item.find('link') is not None else "#"
-        episodes.append({'title': title, 'link': link})
-    
+    print(f"Found {len(episodes)} items in XML.")
     return episodes
 
+# --- EPISODE RECORDS ---
+# Archives merge years of feeds, so episodes are kept column by column rather
+# than as one dict each, and nodes refer to them by row number.
+EPISODE_COLUMNS = ("guid", "title", "link", "pub_date", "enclosure_url", "enclosure_length", "duration")
+URL_COLUMNS = ("link", "enclosure_url")
+INTERNED_COLUMNS = ("duration",)
+# scheme://host/ plus the leading path segments without digits, e.g. https://www.patreon.com/posts/
+URL_PREFIX_RE = re.compile(r"[a-z][a-z0-9+.-]*://[^/?#]*/(?:[^/?#\d]*/)*", re.I)
+
+class UrlColumn:
+    """URLs (or None) stored as an index into the distinct prefixes plus the remainder."""
+    __slots__ = ("prefixes", "prefix_ids", "ids", "rests")
+
+    def __init__(self):
+        self.prefixes = [""]
+        self.prefix_ids = {"": 0}
+        self.ids = array('I')
+        self.rests = []
+
+    def append(self, url):
+        match = URL_PREFIX_RE.match(url) if url else None
+        prefix = match.group() if match else ""
+        prefix_id = self.prefix_ids.get(prefix)
+        if prefix_id is None:
+            prefix_id = self.prefix_ids[prefix] = len(self.prefixes)
+            self.prefixes.append(prefix)
+        self.ids.append(prefix_id)
+        self.rests.append(url if url is None else url[len(prefix):])
+
+    def __getitem__(self, i):
+        rest = self.rests[i]
+        return rest if rest is None else self.prefixes[self.ids[i]] + rest
+
+    def __len__(self):
+        return len(self.rests)
+
+class IntColumn:
+    """Non-negative ints (or None) in a machine array instead of one int object each."""
+    __slots__ = ("values",)
+    MISSING = -1
+
+    def __init__(self):
+        self.values = array('q')
+
+    def append(self, value):
+        self.values.append(self.MISSING if value is None or value >= 2 ** 63 else value)
+
+    def __getitem__(self, i):
+        value = self.values[i]
+        return None if value == self.MISSING else value
+
+    def __len__(self):
+        return len(self.values)
+
+class EpisodeTable:
+    """
+    Episodes (dicts as iter_rss_feed yields them) stored one column per field.
+    URLs share their host prefixes, lengths sit in an int array and repeated
+    strings are interned. Rows are addressed by index; row(i) rebuilds the dict
+    and iterating yields every row's dict.
+    """
+
+    def __init__(self, episodes=()):
+        self.columns = {}
+        for field in EPISODE_COLUMNS:
+            if field in URL_COLUMNS:
+                self.columns[field] = UrlColumn()
+            elif field == "enclosure_length":
+                self.columns[field] = IntColumn()
+            else:
+                self.columns[field] = []
+        self.titles = self.columns['title']
+        for ep in episodes:
+            self.append(ep)
+
+    def append(self, ep):
+        """Adds an episode dict and returns its row number."""
+        for field, column in self.columns.items():
+            value = ep.get(field)
+            column.append(sys.intern(value) if value and field in INTERNED_COLUMNS else value)
+        return len(self.titles) - 1
+
+    def ids(self, i):
+        """Same identities as episode_ids() for row i."""
+        columns = self.columns
+        fallback = lambda: item_fallback_key(self.titles[i], columns['pub_date'][i], columns['enclosure_url'][i])
+        return episode_ids(columns['guid'][i], columns['link'][i], fallback)
+
+    def key(self, i):
+        """Same key as episode_key(self.row(i))."""
+        return self.ids(i)[0][1]
+
+    def row(self, i):
+        return {field: column[i] for field, column in self.columns.items()}
+
+    def __len__(self):
+        return len(self.titles)
+
+    def __iter__(self):
+        return map(self.row, range(len(self)))
+
+class NodeEpisodes:
+    """
+    A node's episodes as row numbers into a shared EpisodeTable. len() and
+    iteration (episode dicts) work like the list of dicts it replaces.
+    """
+    __slots__ = ("table", "rows")
+
+    def __init__(self, table, rows=()):
+        self.table = table
+        self.rows = array('I', rows)
+
+    def append(self, row):
+        self.rows.append(row)
+
+    def extend(self, other):
+        if other.table is not self.table:
+            raise ValueError("can't combine episodes from different tables")
+        self.rows.extend(other.rows)
+
+    def column(self, field):
+        """One field's values, in row order."""
+        column = self.table.columns[field]
+        return [column[i] for i in self.rows]
+
+    def values(self, fields):
+        """One list of the given fields' values per row, in row order."""
+        columns = [self.table.columns[field] for field in fields]
+        return [[column[i] for column in columns] for i in self.rows]
+
+    def sort_newest_first(self):
+        """Orders rows by pub_date, newest first; undated episodes go last."""
+        dates = self.table.columns['pub_date']
+        self.rows = array('I', sorted(self.rows, key=lambda i: dates[i] or "", reverse=True))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return map(self.table.row, self.rows)
+
+# --- FEED FETCHING ---
+FETCH_TIMEOUT = 30
+FETCH_WORKERS = 8
+FETCH_MAX_REDIRECTS = 5
+FETCH_CHUNK_SIZE = 64 * 1024
+FETCH_USER_AGENT = "pel-mindmap"
+
+def is_feed_url(path):
+    return path.startswith(("http://", "https://"))
+
+class ConnectionPool:
+    """
+    Idle HTTP(S) connections kept per host, so feeds on the same server
+    reuse one keep-alive connection instead of reconnecting (and redoing
+    the TLS handshake) each time. Safe to share between fetch threads.
+    """
+    def __init__(self, timeout=FETCH_TIMEOUT):
+        self.timeout = timeout
+        self.idle = defaultdict(list)
+        self.lock = threading.Lock()
+
+    def _connect(self, scheme, host):
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(host, timeout=self.timeout)
+
+    def get(self, scheme, host, target, headers):
+        """Sends a GET; returns (connection, response). Falls back to a new connection if an idle one went stale."""
+        with self.lock:
+            conn = self.idle[scheme, host].pop() if self.idle[scheme, host] else None
+        if conn is not None:
+            try:
+                conn.request("GET", target, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.HTTPException, ConnectionError):
+                conn.close()
+        conn = self._connect(scheme, host)
+        try:
+            conn.request("GET", target, headers=headers)
+            return conn, conn.getresponse()
+        except BaseException:
+            conn.close()
+            raise
+
+    def release(self, scheme, host, conn, response):
+        """Returns the connection for reuse if its response was read to the end and the server keeps it open."""
+        if response is not None and response.isclosed() and not response.will_close:
+            with self.lock:
+                self.idle[scheme, host].append(conn)
+        else:
+            conn.close()
+
+    def close(self):
+        with self.lock:
+            for conns in self.idle.values():
+                for conn in conns:
+                    conn.close()
+            self.idle.clear()
+
+def _download(response, path):
+    """Streams a response body into path, gunzipping on the way. Returns its sha256."""
+    digest = hashlib.sha256()
+    gzipped = (response.getheader("Content-Encoding") or "").lower() == "gzip"
+    decoder = zlib.decompressobj(wbits=31) if gzipped else None
+    with open(path, "wb") as f:
+        while True:
+            chunk = response.read(FETCH_CHUNK_SIZE)
+            if not chunk:
+                break
+            if decoder:
+                chunk = decoder.decompress(chunk)
+            digest.update(chunk)
+            f.write(chunk)
+        if decoder:
+            chunk = decoder.flush()
+            digest.update(chunk)
+            f.write(chunk)
+    return digest.hexdigest()
+
+def feed_cache_path(cache_dir, url):
+    return os.path.join(cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest()[:16] + ".xml")
+
+def fetch_feed(pool, url, entry, cache_dir):
+    """
+    Refreshes the cached copy of one feed with a conditional GET. entry is
+    the feed's cache record (etag, last_modified, sha256) and is updated in
+    place. Returns True if the cached XML changed, False on a 304 or when
+    the server resent identical content.
+    """
+    path = feed_cache_path(cache_dir, url)
+    headers = {"User-Agent": FETCH_USER_AGENT, "Accept-Encoding": "gzip"}
+    if os.path.exists(path):
+        if entry.get('etag'):
+            headers["If-None-Match"] = entry['etag']
+        if entry.get('last_modified'):
+            headers["If-Modified-Since"] = entry['last_modified']
+
+    location = url
+    for _ in range(FETCH_MAX_REDIRECTS + 1):
+        parts = urlsplit(location)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        conn, response = pool.get(parts.scheme, parts.netloc, target, headers)
+        try:
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                response.read()
+                location = urljoin(location, response.getheader("Location"))
+                continue
+            if response.status == 304:
+                response.read()
+                return False
+            if response.status != 200:
+                response.read()
+                raise OSError(f"HTTP {response.status} {response.reason}")
+            tmp_path = f"{path}.{threading.get_ident()}.part"
+            try:
+                digest = _download(response, tmp_path)
+                changed = digest != entry.get('sha256') or not os.path.exists(path)
+                if changed:
+                    os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            entry['etag'] = response.getheader("ETag")
+            entry['last_modified'] = response.getheader("Last-Modified")
+            entry['sha256'] = digest
+            return changed
+        finally:
+            pool.release(parts.scheme, parts.netloc, conn, response)
+    raise OSError(f"too many redirects from {url}")
+
+def load_feed_cache(cache_dir):
+    os.makedirs(cache_dir, exist_ok=True)
+    return load_state(os.path.join(cache_dir, "index.json"))
+
+def save_feed_cache(cache_dir, cache):
+    write_if_changed(os.path.join(cache_dir, "index.json"), json.dumps(cache, indent=2, sort_keys=True))
+
+def fetch_feeds(urls, cache, cache_dir, workers=FETCH_WORKERS):
+    """
+    Fetches feeds concurrently over pooled connections into cache_dir.
+    Returns {url: (local path, changed)}. A feed that can't be fetched falls
+    back to its cached copy (as unchanged) or is reported and left out.
+    """
+    entries = cache.setdefault('feeds', {})
+    results = {}
+    pool = ConnectionPool()
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls)))) as executor:
+            futures = {url: executor.submit(fetch_feed, pool, url, entries.setdefault(url, {}), cache_dir) for url in urls}
+            for url, future in futures.items():
+                path = feed_cache_path(cache_dir, url)
+                try:
+                    results[url] = (path, future.result())
+                except (OSError, http.client.HTTPException) as e:
+                    if os.path.exists(path):
+                        print(f"Error fetching {url}: {e}; using the cached copy")
+                        results[url] = (path, False)
+                    else:
+                        print(f"Error fetching {url}: {e}")
+    finally:
+        pool.close()
+    return results
+
+# --- OUTPUT FILES ---
+def _encoded(chunks):
+    for chunk in chunks:
+        yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+def write_if_changed(path, content):
+    """
+    Atomically replaces path with content (str, bytes, or an iterable of
+    either that is streamed through a temp file and os.replace), or does
+    nothing if the file already holds exactly that content. Returns True if
+    the file was written.
+    """
+    streamed = not isinstance(content, (str, bytes))
+    if not streamed:
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        try:
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+        except FileNotFoundError:
+            pass
+        content = [data]
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        # Streamed content is compared with the old file as it goes, so it is never held whole
+        existing = open(path, "rb") if streamed and os.path.exists(path) else None
+        same = existing is not None
+        try:
+            with open(tmp_path, "wb") as f:
+                for data in _encoded(content):
+                    if same and existing.read(len(data)) != data:
+                        same = False
+                    f.write(data)
+            same = same and existing.read(1) == b""
+        finally:
+            if existing is not None:
+                existing.close()
+        if same:
+            return False
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return True
+
+def content_hash(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+def page_relative(page_dir, directory):
+    """
+    directory relative to page_dir, the root the page is served from. Raises
+    ValueError for a directory outside it, which the page couldn't load from.
+    """
+    relative = os.path.relpath(os.path.abspath(directory), os.path.abspath(page_dir))
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        raise ValueError(f"{directory} is outside {page_dir}, where the page is served from")
+    return relative
+
+def url_path(page_dir, directory, file_name):
+    """Relative URL of file_name in directory, for a page written to page_dir."""
+    relative = page_relative(page_dir, directory)
+    return "/".join(([] if relative == os.curdir else relative.split(os.sep)) + [file_name])
+
+def write_hashed_assets(asset_dir, assets):
+    """
+    Writes {logical name: content} as immutable content-hashed files, e.g.
+    app.js -> app.3f2a9c1d8e7b.js, plus a manifest.json mapping one to the
+    other. content may be an iterable of chunks, which is hashed as it is
+    streamed to disk. Returns the manifest. Old hashed files are left for
+    clients that still hold an older page.
+    """
+    os.makedirs(asset_dir, exist_ok=True)
+    manifest = {}
+    for name, content in assets.items():
+        stem, ext = os.path.splitext(name)
+        tmp_path = os.path.join(asset_dir, f".{name}.{os.getpid()}.tmp")
+        digest = hashlib.sha256()
+        try:
+            with open(tmp_path, "wb") as f:
+                for data in _encoded([content] if isinstance(content, (str, bytes)) else content):
+                    digest.update(data)
+                    f.write(data)
+            hashed_name = f"{stem}.{digest.hexdigest()[:12]}{ext}"
+            path = os.path.join(asset_dir, hashed_name)
+            if not os.path.exists(path):
+                os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        manifest[name] = hashed_name
+    write_if_changed(os.path.join(asset_dir, "manifest.json"), json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return manifest
+
+# --- INCREMENTAL STATE ---
+# Bump when the classification heuristics change so old state files are discarded.
+STATE_VERSION = 1
+
+def knowledge_hash(db):
+    """Fingerprint of everything that decides where an episode lands."""
+    payload = json.dumps({"version": STATE_VERSION, "db": db, "buckets": TOPIC_BUCKETS}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+MISSING_LINK = "#"  # What _episode_from_item fills in for an item without <link>
+
+def episode_ids(guid, link, fallback):
+    """
+    The (kind, value) identities episodes are deduplicated on: the guid and
+    the link each count on their own, so a copy that carries only one of them
+    still matches. The "#" placeholder is never an identity; an item with
+    neither uses fallback(), a key built from its title, date and enclosure.
+    """
+    ids = []
+    if guid:
+        ids.append(("guid", guid))
+    if link and link != MISSING_LINK:
+        ids.append(("link", link))
+    return ids or [("item", fallback())]
+
+def item_fallback_key(title, pub_date, enclosure_url):
+    return f"{title}|{pub_date or ''}|{enclosure_url or ''}"
+
+def episode_key(ep):
+    """Key of an episode in the state file and the store: its first identity (guid, else link)."""
+    fallback = lambda: item_fallback_key(ep.get('title'), ep.get('pub_date'), ep.get('enclosure_url'))
+    return episode_ids(ep.get('guid'), ep.get('link'), fallback)[0][1]
+
+def load_state(path):
+    """Loads the classification state, or an empty one if the file is missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable state file {path}: {e}")
+        return {}
+
+def save_state(path, state):
+    write_if_changed(path, json.dumps(state, separators=(",", ":")))
+
+# Optional "Ep. 123:" and "Closereads:" prefixes, then an optional "[Name] on " in the same pass
+TITLE_PREFIX_ON_RE = re.compile(r'^(?P<prefix>(?:Ep\.?\s*\d+[:\.]?\s*)?(?:Closereads:?\s*)?)(?:(?P<on>.*?) on )?')
+# "[Name]'s ", matched from the end of the prefix
+TITLE_POSSESSIVE_RE = re.compile(r"(.*?)'s ")
+
+@lru_cache(maxsize=65536)
 def infer_subject_from_title(title):
     """
     Intelligent extraction: tries to find "Name" in "Ep X: Name on Topic"
+    Results are memoized per title, so reruns over a mostly unchanged feed are cheap.
     """
     # Pattern 1: "Ep. 123: [Name] on [Topic]" or "Ep. 123: [Name]'s [Book]"
     # We look for capitalized words immediately following the colon or start
-    
-    # Clean title of "Ep. 123:" prefix
-    clean_title = re.sub(r'^Ep\.?\s*\d+[:\.]?\s*', '', title)
-    clean_title = re.sub(r'^Closereads:?\s*', '', clean_title)
-    
+    match = TITLE_PREFIX_ON_RE.match(title)
+
     # Heuristic 1: Look for "X on Y" pattern
-    on_match = re.search(r'^(.*?) on ', clean_title)
-    if on_match:
-        potential_name = on_match.group(1).strip()
+    if match.group('on') is not None:
+        potential_name = match.group('on').strip()
         if len(potential_name.split()) <= 3: # Avoid long phrases
             return potential_name
 
     # Heuristic 2: Look for "X's Y" pattern (e.g. "Hegel's Logic")
-    possessive_match = re.search(r'^(.*?)\'s ', clean_title)
+    possessive_match = TITLE_POSSESSIVE_RE.match(title, match.end('prefix'))
     if possessive_match:
         potential_name = possessive_match.group(1).strip()
         if len(potential_name.split()) <= 3:
@@ -206,10 +803,55 @@ def infer_subject_from_title(title):
 
     return None
 
-def categorize_episodes(episodes, db):
-    """Maps episodes to the Knowledge Base or Creates Dynamic Nodes."""
+def classify_title(title, kb_matcher, bucket_matcher):
+    """
+    Returns (node_id, inferred_name) for a title. inferred_name is only set when
+    the node comes from infer_subject_from_title.
+    """
+    # 1. Try Hardcoded DB
+    key = kb_matcher.match(title)
+    if key:
+        return key, None
+
+    # 2. Dynamic Inference (The Smart Fix)
+    inferred_name = infer_subject_from_title(title)
+    if inferred_name:
+        # Create a specific ID for this person
+        return normalize(inferred_name).replace(" ", "_"), inferred_name
+
+    # 3. Topic Buckets
+    key = bucket_matcher.match(title)
+    if key:
+        return key, None
+
+    # 4. Fallback
+    return "general", None
+
+def assign_episodes(episodes, db, matcher=None, state=None):
+    """
+    Maps episodes to the Knowledge Base or Creates Dynamic Nodes, returning every
+    node (empty ones included) keyed by id. episodes is an EpisodeTable or
+    any iterable of episode dicts, which is read into one; every node's
+    episodes are rows of that table. Pass a prebuilt KeywordMatcher(db) to
+    reuse it across calls, and a state dict (see load_state) to skip
+    reclassifying episodes seen in a previous run.
+    """
     
+    table = episodes if isinstance(episodes, EpisodeTable) else EpisodeTable(episodes)
     output_data = {}
+    kb_matcher = matcher or KeywordMatcher(db)
+    bucket_matcher = KeywordMatcher(TOPIC_BUCKETS)
+
+    previous = {}
+    if state is not None:
+        kb_hash = knowledge_hash(db)
+        if state.get('knowledge_hash') == kb_hash:
+            previous = state.get('assignments', {})
+        elif state:
+            print("Knowledge base changed since last run; reclassifying everything.")
+        state['knowledge_hash'] = kb_hash
+    assignments = {}
+    reused_count = 0
     
     # Initialize hardcoded nodes
     for key, info in db.items():
@@ -219,7 +861,7 @@ def categorize_episodes(episodes, db):
             "category": info['category'],
             "sep_link": info['sep'],
             "dependencies": info['deps'],
-            "episodes": []
+            "episodes": NodeEpisodes(table)
         }
     
     # Add bucket nodes
@@ -230,240 +872,1141 @@ def categorize_episodes(episodes, db):
             "category": "Topic",
             "sep_link": None,
             "dependencies": [],
-            "episodes": []
+            "episodes": NodeEpisodes(table)
         }
 
     mapped_count = 0
     
-    for ep in episodes:
-        title = ep['title']
-        title_lower = normalize(title)
-        matched = False
-        
-        # 1. Try Hardcoded DB
-        for key, info in db.items():
-            for keyword in info['keywords']:
-                if normalize(keyword) in title_lower:
-                    output_data[key]['episodes'].append(ep)
-                    matched = True
-                    break
-            if matched: break
-        
-        # 2. Dynamic Inference (The Smart Fix)
-        if not matched:
-            inferred_name = infer_subject_from_title(title)
-            if inferred_name:
-                # Create a specific ID for this person
-                node_id = normalize(inferred_name).replace(" ", "_")
-                
-                # If node doesn't exist, create it dynamically
-                if node_id not in output_data:
-                    output_data[node_id] = {
-                        "id": node_id,
-                        "name": inferred_name,
-                        "category": "Inferred", # Visual distinction
-                        "sep_link": None,
-                        "dependencies": [],
-                        "episodes": []
-                    }
-                output_data[node_id]['episodes'].append(ep)
-                matched = True
-
-        # 3. Topic Buckets
-        if not matched:
-            for key, info in TOPIC_BUCKETS.items():
-                if key == "general": continue
-                for keyword in info['keywords']:
-                    if normalize(keyword) in title_lower:
-                        output_data[key]['episodes'].append(ep)
-                        matched = True
-                        break
-                if matched: break
-
-        # 4. Fallback
-        if not matched:
-            output_data['general']['episodes'].append(ep)
-        
+    for row, title in enumerate(table.titles):
+        key = table.key(row)
+        cached = previous.get(key)
+        if cached and cached[0] == title:
+            _, node_id, inferred_name = cached
+            reused_count += 1
+        else:
+            node_id, inferred_name = classify_title(title, kb_matcher, bucket_matcher)
+        assignments[key] = [title, node_id, inferred_name]
+
+        # If an inferred node doesn't exist, create it dynamically
+        if node_id not in output_data:
+            output_data[node_id] = {
+                "id": node_id,
+                "name": inferred_name,
+                "category": "Inferred", # Visual distinction
+                "sep_link": None,
+                "dependencies": [],
+                "episodes": NodeEpisodes(table)
+            }
+        output_data[node_id]['episodes'].append(row)
         mapped_count += 1
 
-    # Cleanup: Remove nodes with 0 episodes unless they are dependencies
+    if state is not None:
+        # Only keep items still in the feed so the state file doesn't grow forever
+        state['assignments'] = assignments
+        print(f"Reused {reused_count} classifications, classified {mapped_count - reused_count} new episodes.")
+
+    return output_data
+
+def merge_node_tables(tables):
+    """
+    Merges assign_episodes() results from several feeds into one table.
+    An episode present in more than one feed (same guid or same link, see
+    episode_ids) is kept once, from the first feed that has it. Several
+    feeds' episodes are copied into one new EpisodeTable; a single feed
+    keeps its own.
+    """
+    merged = {}
+    seen = set()
+    copy = len(tables) > 1
+    episodes = EpisodeTable()
+    for table in tables:
+        for key, data in table.items():
+            source = data['episodes']
+            if key not in merged:
+                merged[key] = {**data, "episodes": NodeEpisodes(episodes if copy else source.table)}
+            for row in source.rows:
+                ids = source.table.ids(row)
+                if seen.isdisjoint(ids):
+                    merged[key]['episodes'].append(episodes.append(source.table.row(row)) if copy else row)
+                seen.update(ids)
+    return merged
+
+def finalize_nodes(output_data):
+    """Drops nodes nobody needs and reports bucket sizes."""
+
+    # Cleanup: Remove nodes with 0 episodes unless something active depends on them,
+    # directly or through a chain of prerequisites
     active_keys = set()
-    for key, data in output_data.items():
-        if data['episodes']:
-            active_keys.add(key)
-            for dep in data['dependencies']:
-                if dep in output_data: 
-                    active_keys.add(dep)
+    stack = [key for key, data in output_data.items() if data['episodes']]
+    while stack:
+        key = stack.pop()
+        if key in active_keys:
+            continue
+        active_keys.add(key)
+        stack.extend(dep for dep in output_data[key]['dependencies'] if dep in output_data)
     
-    final_json = [output_data[key] for key in active_keys]
+    # Keep output_data's order (knowledge base, buckets, then inferred nodes as first
+    # seen) so identical input always yields identical output
+    final_json = [data for key, data in output_data.items() if key in active_keys]
 
     # Report
-    print(f"Total Episodes Processed: {len(episodes)}")
+    print(f"Total Episodes Processed: {sum(len(data['episodes']) for data in output_data.values())}")
     print(f"General/Misc bucket size: {len(output_data['general']['episodes'])}")
     
     return final_json
 
-def generate_html(json_data):
-    """Generates the Single Page App."""
-    
-    json_str = json.dumps(json_data, indent=2)
-    
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Philosophy Podcast Mind Map</title>
-    <script src="https://d3js.org/d3.v7.min.js"></script>
-    <style>
-        body {{ font-family: 'Helvetica Neue', Arial, sans-serif; background-color: #1a1a1a; color: #f0f0f0; margin: 0; overflow: hidden; }}
-        #container {{ display: flex; height: 100vh; }}
-        #sidebar {{ width: 350px; background-color: #2c2c2c; padding: 20px; box-shadow: 2px 0 5px rgba(0,0,0,0.5); overflow-y: auto; z-index: 10; }}
-        #graph-area {{ flex-grow: 1; position: relative; }}
-        
-        h1 {{ font-size: 1.2em; color: #61dafb; margin-top: 0; }}
-        h2 {{ font-size: 1.5em; border-bottom: 1px solid #444; padding-bottom: 10px; }}
-        
-        .episode-link {{ display: block; margin: 5px 0; color: #ddd; text-decoration: none; padding: 5px; background: #3a3a3a; border-radius: 4px; }}
-        .episode-link:hover {{ background: #505050; color: #fff; }}
-        
-        .sep-link {{ display: inline-block; margin-top: 10px; color: #ff6b6b; font-weight: bold; text-decoration: none; }}
-        .sep-link:hover {{ text-decoration: underline; }}
+def categorize_episodes(episodes, db, matcher=None, state=None):
+    """Classifies one feed's episodes and returns the active nodes. See assign_episodes."""
+    output_data = assign_episodes(episodes, db, matcher, state)
+    resolve_inferred_nodes(output_data, db)
+    return finalize_nodes(output_data)
 
-        .search-container {{ margin-bottom: 20px; }}
-        input[type="text"] {{ width: 100%; padding: 10px; border-radius: 4px; border: none; background: #444; color: white; }}
-        
-        .node circle {{ stroke: #fff; stroke-width: 1.5px; cursor: pointer; transition: all 0.3s; }}
-        .node:hover circle {{ stroke: #61dafb; stroke-width: 3px; r: 25 !important; }}
-        .node text {{ font: 10px sans-serif; pointer-events: none; fill: #eee; text-shadow: 1px 1px 2px #000; }}
-        
-        .link {{ fill: none; stroke: #555; stroke-opacity: 0.6; marker-end: url(#arrow); }}
-        
-        /* Category Colors */
-        .cat-Ancient {{ fill: #ff9f43; }}
-        .cat-Medieval {{ fill: #feca57; }}
-        .cat-Modern {{ fill: #ff6b6b; }}
-        .cat-19th_Century {{ fill: #ff9ff3; }}
-        .cat-Analytic {{ fill: #54a0ff; }}
-        .cat-Continental {{ fill: #00d2d3; }}
-        .cat-Phenomenology {{ fill: #1dd1a1; }}
-        .cat-Existentialism {{ fill: #10ac84; }}
-        .cat-Eastern {{ fill: #5f27cd; }}
-        .cat-Topic {{ fill: #c8d6e5; }}
-        .cat-Literature {{ fill: #8395a7; }}
-        .cat-Inferred {{ fill: #a55eea; }} /* Purple for auto-discovered */
-        .cat-Other {{ fill: #777; }}
+def ingest_feed(path, db, state=None):
+    """
+    Parses and classifies a single feed file. Runs in a worker process when
+    several feeds are built at once, so it returns the updated state too.
+    """
+    return assign_episodes(iter_rss_feed(path), db, state=state), state
 
-        #dependency-list {{ margin-top: 15px; font-size: 0.9em; color: #aaa; }}
-        .dep-item {{ color: #61dafb; cursor: pointer; }}
-        
-        .legend {{ position: absolute; bottom: 20px; right: 20px; background: rgba(0,0,0,0.7); padding: 10px; border-radius: 5px; font-size: 0.8em; }}
-        .legend-item {{ display: flex; align-items: center; margin: 2px 0; }}
-        .legend-color {{ width: 12px; height: 12px; margin-right: 5px; border-radius: 50%; }}
-    </style>
-</head>
-<body>
+def find_feed_files(paths):
+    """Expands directories into the RSS/XML files they contain, in a stable order."""
+    feeds = []
+    for path in paths:
+        if os.path.isdir(path):
+            feeds.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.lower().endswith(('.xml', '.rss'))
+            ))
+        else:
+            feeds.append(path)
+    return feeds
 
-<div id="container">
-    <div id="sidebar">
-        <h1>PEL Mind Map</h1>
-        <div class="search-container">
-            <input type="text" id="search" placeholder="Search philosopher or topic...">
-        </div>
-        <div id="details">
-            <p><i>Click a node to view episodes and details.</i></p>
-        </div>
-    </div>
-    <div id="graph-area">
-        <div class="legend">
-            <div class="legend-item"><div class="legend-color" style="background:#ff9f43"></div>Ancient</div>
-            <div class="legend-item"><div class="legend-color" style="background:#ff6b6b"></div>Modern</div>
-            <div class="legend-item"><div class="legend-color" style="background:#00d2d3"></div>Continental</div>
-            <div class="legend-item"><div class="legend-color" style="background:#54a0ff"></div>Analytic</div>
-            <div class="legend-item"><div class="legend-color" style="background:#a55eea"></div>Inferred/Guest</div>
-        </div>
-    </div>
-</div>
+def ingest_feeds(feed_paths, db, states=None, jobs=None, metrics=None):
+    """
+    Parses and classifies many feeds in parallel and merges them into one node
+    table. states maps feed path -> per-feed state dict and is updated in place.
+    Feeds that fail to parse are reported and skipped.
+    """
+    tracked = states is not None
+    states = states if tracked else {}
+    results = {}
 
-<script>
-    const rawData = {json_str};
+    if len(feed_paths) == 1 or jobs == 1:
+        for path in feed_paths:
+            try:
+                results[path] = ingest_feed(path, db, states.get(path, {}) if tracked else None)
+            except ET.ParseError as e:
+                print(f"Error parsing XML in {path}: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {path: executor.submit(ingest_feed, path, db, states.get(path, {}) if tracked else None) for path in feed_paths}
+            for path, future in futures.items():
+                try:
+                    results[path] = future.result()
+                except ET.ParseError as e:
+                    print(f"Error parsing XML in {path}: {e}")
 
-    const nodes = rawData.map(d => ({{ ...d }}));
-    const links = [];
-    const nodeMap = new Map(nodes.map(n => [n.id, n]));
+    tables = []
+    for path in feed_paths:
+        if path in results:
+            table, feed_state = results[path]
+            if tracked:
+                states[path] = feed_state
+            tables.append(table)
+    merged = merge_node_tables(tables)
 
-    nodes.forEach(sourceNode => {{
-        if (sourceNode.dependencies) {{
-            sourceNode.dependencies.forEach(targetId => {{
-                if (nodeMap.has(targetId)) {{
-                    links.push({{ source: sourceNode.id, target: targetId }});
-                }}
-            }});
-        }}
-    }});
+    if metrics:
+        parsed = sum(len(data['episodes']) for table in tables for data in table.values())
+        metrics.count('feeds_failed', len(feed_paths) - len(tables))
+        metrics.count('items_parsed', parsed)
+        metrics.count('duplicates_dropped', parsed - sum(len(data['episodes']) for data in merged.values()))
+    return merged
 
-    const width = document.getElementById('graph-area').clientWidth;
-    const height = document.getElementById('graph-area').clientHeight;
+# --- EPISODE STORE ---
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    sep_link TEXT,
+    dependencies TEXT NOT NULL DEFAULT '[]',
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS episodes (
+    key TEXT PRIMARY KEY,
+    guid TEXT,
+    node_id TEXT NOT NULL REFERENCES nodes(id),
+    title TEXT NOT NULL,
+    link TEXT,
+    pub_date TEXT,
+    enclosure_url TEXT,
+    enclosure_length INTEGER,
+    duration TEXT
+);
+CREATE INDEX IF NOT EXISTS episodes_guid ON episodes(guid);
+CREATE INDEX IF NOT EXISTS episodes_node ON episodes(node_id, pub_date);
+CREATE INDEX IF NOT EXISTS episodes_pub_date ON episodes(pub_date);
+CREATE INDEX IF NOT EXISTS nodes_category ON nodes(category);
+"""
+def open_store(path):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(STORE_SCHEMA)
+    return conn
 
-    const svg = d3.select("#graph-area").append("svg")
-        .attr("width", width)
-        .attr("height", height)
-        .call(d3.zoom().on("zoom", (event) => {{
-            g.attr("transform", event.transform);
-        }}));
+def store_episodes(path, json_data):
+    """
+    Upserts the built nodes and their episodes into the SQLite store at path
+    in a single transaction. Episodes are keyed like the state file (guid,
+    else link, else title), so reruns update rows in place and episodes that
+    have since left the feed are kept.
+    """
+    conn = open_store(path)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO nodes (id, name, category, sep_link, dependencies, position) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET name=excluded.name, category=excluded.category, "
+                "sep_link=excluded.sep_link, dependencies=excluded.dependencies, position=excluded.position",
+                ((node['id'], node['name'], node['category'], node.get('sep_link'), json.dumps(node['dependencies']), i)
+                 for i, node in enumerate(json_data)),
+            )
+            columns = ", ".join(EPISODE_COLUMNS)
+            updates = ", ".join(f"{column}=excluded.{column}" for column in ("node_id",) + EPISODE_COLUMNS)
+            conn.executemany(
+                f"INSERT INTO episodes (key, node_id, {columns}) VALUES ({', '.join('?' * (len(EPISODE_COLUMNS) + 2))}) "
+                f"ON CONFLICT(key) DO UPDATE SET {updates}",
+                ((episode_key(ep), node['id']) + tuple(ep.get(column) for column in EPISODE_COLUMNS)
+                 for node in json_data for ep in node['episodes']),
+            )
+    finally:
+        conn.close()
 
-    const g = svg.append("g");
+def _episode_filters(node=None, category=None, text=None, since=None, until=None):
+    """SQL WHERE clause and parameters shared by the store queries."""
+    clauses, params = [], []
+    if node:
+        clauses.append("e.node_id = ?")
+        params.append(node)
+    if category:
+        clauses.append("n.category = ?")
+        params.append(category)
+    if text:
+        clauses.append("e.title LIKE ? ESCAPE '\\'")
+        params.append("%" + re.sub(r"([%_\\])", r"\\\1", text) + "%")
+    if since:
+        clauses.append("e.pub_date >= ?")
+        params.append(since)
+    if until:
+        # Dates are ISO strings, so anything on the `until` day sorts below its successor
+        clauses.append("e.pub_date < ?")
+        params.append(until + "\uffff")
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
 
-    svg.append("defs").selectAll("marker")
-        .data(["arrow"])
-        .enter().append("marker")
-        .attr("id", d => d)
-        .attr("viewBox", "0 -5 10 10")
-        .attr("refX", 25)
-        .attr("refY", 0)
-        .attr("markerWidth", 6)
-        .attr("markerHeight", 6)
-        .attr("orient", "auto")
-        .append("path")
-        .attr("d", "M0,-5L10,0L0,5")
-        .attr("fill", "#555");
+def query_episodes(path, node=None, category=None, text=None, since=None, until=None, limit=None):
+    """Returns matching episodes, newest first, as dicts with node_id/node_name/category added."""
+    where, params = _episode_filters(node, category, text, since, until)
+    sql = ("SELECT e.*, n.name AS node_name, n.category FROM episodes e JOIN nodes n ON n.id = e.node_id"
+           f"{where} ORDER BY e.pub_date DESC, e.rowid")
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    conn = open_store(path)
+    try:
+        return [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
 
-    const simulation = d3.forceSimulation(nodes)
-        .force("link", d3.forceLink(links).id(d => d.id).distance(100))
-        .force("charge", d3.forceManyBody().strength(-400))
-        .force("center", d3.forceCenter(width / 2, height / 2))
-        .force("collide", d3.forceCollide(30));
+def episodes_per_year(path, **filters):
+    """Returns [(category, year, episode count)] for the episodes matching filters."""
+    where, params = _episode_filters(**filters)
+    conn = open_store(path)
+    try:
+        return [tuple(row) for row in conn.execute(
+            "SELECT n.category, substr(e.pub_date, 1, 4) AS year, COUNT(*) FROM episodes e "
+            f"JOIN nodes n ON n.id = e.node_id{where} GROUP BY n.category, year ORDER BY n.category, year",
+            params,
+        )]
+    finally:
+        conn.close()
 
-    const link = g.append("g")
-        .attr("class", "links")
-        .selectAll("line")
-        .data(links)
-        .enter().append("line")
-        .attr("class", "link");
+def load_store(path, **filters):
+    """
+    Rebuilds the node table (as assign_episodes returns it) from the store,
+    with only the episodes matching filters, so finalize_nodes and
+    generate_html can produce a partial page without parsing any XML.
+    """
+    table = EpisodeTable()
+    conn = open_store(path)
+    try:
+        output_data = {}
+        for row in conn.execute("SELECT * FROM nodes ORDER BY position"):
+            output_data[row['id']] = {
+                "id": row['id'],
+                "name": row['name'],
+                "category": sys.intern(row['category']),
+                "sep_link": row['sep_link'],
+                "dependencies": json.loads(row['dependencies']),
+                "episodes": NodeEpisodes(table),
+            }
+    finally:
+        conn.close()
+    for row in query_episodes(path, **filters):
+        output_data[row['node_id']]['episodes'].append(table.append(row))
+    return output_data
 
-    const node = g.append("g")
-        .attr("class", "nodes")
-        .selectAll("g")
-        .data(nodes)
-        .enter().append("g")
-        .attr("class", "node")
-        .call(d3.drag()
-            .on("start", dragstarted)
-            .on("drag", dragged)
-            .on("end", dragended));
+def query_main(argv):
+    """`pel.py query STORE [filters]`: ad-hoc queries against a --store database."""
+    parser = argparse.ArgumentParser(prog="pel.py query", description="Queries the episode store written by --store.")
+    parser.add_argument("store", help="SQLite file written by --store")
+    parser.add_argument("--node", help="Only episodes assigned to this node id")
+    parser.add_argument("--category", help="Only episodes in nodes of this category")
+    parser.add_argument("--search", help="Only episodes whose title contains this text (case-insensitive)")
+    parser.add_argument("--since", help="Only episodes published on or after this ISO date")
+    parser.add_argument("--until", help="Only episodes published on or before this ISO date")
+    parser.add_argument("--limit", type=int, help="Show at most this many episodes")
+    parser.add_argument("--per-year", action="store_true", help="Print episode counts per category and year instead")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--html", action="store_true",
+                        help="Build index.html from the matching episodes instead of printing them")
+    args = parser.parse_args(argv)
 
-    node.append("circle")
-        .attr("r", d => 5 + (Math.min(d.episodes.length, 10) * 1.5))
-        .attr("class", d => "cat-" + d.category.replace(/ /g, "_").replace(/&/g,""));
+    if not os.path.exists(args.store):
+        print(f"Error: {args.store} not found.")
+        return
+    filters = dict(node=args.node, category=args.category, text=args.search, since=args.since, until=args.until)
+
+    if args.html:
+        final_data = finalize_nodes(load_store(args.store, **filters))
+        if final_data:
+            generate_html(final_data)
+        else:
+            print("No episodes match.")
+    elif args.per_year:
+        rows = episodes_per_year(args.store, **filters)
+        if args.json:
+            print(json.dumps([{"category": c, "year": y, "episodes": n} for c, y, n in rows], indent=2))
+        for category, year, count in ([] if args.json else rows):
+            print(f"{category:<16} {year or '----'} {count:>5}")
+    else:
+        rows = query_episodes(args.store, limit=args.limit, **filters)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        for row in ([] if args.json else rows):
+            print(f"{(row['pub_date'] or '')[:10]:<10}  {row['node_name'][:24]:<24}  {row['title']}")
+
+# --- ENTITY RESOLUTION ---
+RESOLVE_THRESHOLD = 0.85     # Edit similarity two names, and their last words, need to be merged
+RESOLVE_MIN_LENGTH = 4
+RESOLVE_NOISE_WORDS = {"guest", "dr", "prof", "professor", "interview", "interviews", "conversation", "lecture", "podcast"}
+
+def entity_form(name):
+    """Lowercase, accent- and punctuation-free name without honorifics, for comparing names."""
+    text = unicodedata.normalize("NFKD", name.lower())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(word for word in re.findall(r"\w+", text) if word not in RESOLVE_NOISE_WORDS)
+
+def name_grams(form):
+    padded = f"  {form} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def name_similarity(a, b, threshold=0.0):
+    """
+    1 - (optimal string alignment distance / longer length): typos and
+    transpositions cost one edit. Only the band of the DP table that can stay
+    within threshold is filled, and it gives up with 0.0 as soon as the
+    result can no longer reach threshold.
+    """
+    if a == b:
+        return 1.0
+    longest = max(len(a), len(b))
+    limit = int((1 - threshold) * longest)
+    if abs(len(a) - len(b)) > limit:
+        return 0.0
+    over = limit + 1  # stands in for every distance past the limit
+    before, previous = None, [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [i if i <= limit else over] + [over] * len(b)
+        row_min = current[0]
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            d = previous[j - 1] + (a[i - 1] != b[j - 1])
+            if previous[j] + 1 < d:
+                d = previous[j] + 1
+            if current[j - 1] + 1 < d:
+                d = current[j - 1] + 1
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1] and before[j - 2] + 1 < d:
+                d = before[j - 2] + 1
+            current[j] = d
+            if d < row_min:
+                row_min = d
+        if row_min > limit:
+            return 0.0
+        before, previous = previous, current
+    return 1 - previous[-1] / longest if previous[-1] <= limit else 0.0
+
+def letter_counts(text):
+    counts = {}
+    for ch in text:
+        counts[ch] = counts.get(ch, 0) + 1
+    return counts
+
+def letter_distance(a, b):
+    """Lower bound on the edit distance of two strings from their letter counts (letter_counts) alone."""
+    missing = sum(n - b.get(ch, 0) for ch, n in a.items() if n > b.get(ch, 0))
+    extra = sum(n - a.get(ch, 0) for ch, n in b.items() if n > a.get(ch, 0))
+    return max(missing, extra)
+
+def last_word(form):
+    return form.rsplit(" ", 1)[-1]
+
+class NameIndex:
+    """
+    Trigram inverted index over the distinct last words of the names added,
+    bucketed by word length. A match needs a similar last word, so
+    candidates are blocked on that: only words of a reachable length that
+    share enough trigrams with ours are compared, and only the names ending
+    in the words that match. Only the rarest of a word's trigrams are looked
+    up, so a common ending doesn't make every other word a candidate.
+    """
+    def __init__(self):
+        self.form_ids = {}
+        self.forms = []
+        self.form_letters = []
+        self.members = []
+        self.word_ids = {}
+        self.words = []
+        self.word_grams = []
+        self.word_letters = []
+        self.word_forms = []
+        self.gram_counts = Counter()
+        self.postings = defaultdict(list)  # (trigram, word length) -> word ids
+
+    def add(self, form, owner):
+        i = self.form_ids.get(form)
+        if i is None:
+            i = self.form_ids[form] = len(self.forms)
+            self.forms.append(form)
+            self.form_letters.append(letter_counts(form))
+            self.members.append([])
+            word = last_word(form)
+            w = self.word_ids.get(word)
+            if w is None:
+                w = self.word_ids[word] = len(self.words)
+                grams = name_grams(word)
+                for gram in grams:
+                    self.gram_counts[gram] += 1
+                    self.postings[gram, len(word)].append(w)
+                self.words.append(word)
+                self.word_grams.append(grams)
+                self.word_letters.append(letter_counts(word))
+                self.word_forms.append([])
+            self.word_forms[w].append(i)
+        self.members[i].append((form, owner))
+
+    def similar_words(self, word, threshold=RESOLVE_THRESHOLD):
+        """Yields the ids of indexed last words within threshold edit similarity of word."""
+        grams = name_grams(word)
+        # A match is at most len/threshold long and an edit touches at most four
+        # trigrams (a transposition), so it shares at least min_shared of ours, and
+        # therefore one of any len(grams) - min_shared + 1 of them: probe the rarest that many
+        max_edits = int((1 - threshold) * len(word) / threshold)
+        min_shared = max(1, len(grams) - 4 * max_edits)
+        probe = sorted(grams, key=self.gram_counts.__getitem__)[:len(grams) - min_shared + 1]
+        seen = set()
+        for gram in probe:
+            for length in range(len(word) - max_edits, len(word) + max_edits + 1):
+                seen.update(self.postings.get((gram, length), ()))
+        letters = letter_counts(word)
+        for w in seen:
+            other = self.words[w]
+            # The same bounds again with this pair's own edit budget, as name_similarity computes it
+            edits = int((1 - threshold) * max(len(word), len(other)))
+            if (abs(len(word) - len(other)) <= edits
+                    and len(grams & self.word_grams[w]) >= max(len(grams), len(self.word_grams[w])) - 4 * edits
+                    and letter_distance(letters, self.word_letters[w]) <= edits
+                    and name_similarity(word, other, threshold) >= threshold):
+                yield w
+
+    def candidates(self, form, threshold=RESOLVE_THRESHOLD):
+        """
+        Yields (form, owner) of indexed names within threshold edit similarity
+        of form, both as a whole and by last word.
+        """
+        letters = letter_counts(form)
+        for w in self.similar_words(last_word(form), threshold):
+            for i in self.word_forms[w]:
+                other = self.forms[i]
+                edits = int((1 - threshold) * max(len(form), len(other)))
+                if (abs(len(form) - len(other)) <= edits
+                        and letter_distance(letters, self.form_letters[i]) <= edits
+                        and name_similarity(form, other, threshold) >= threshold):
+                    yield from self.members[i]
+
+def resolve_threshold(value):
+    """argparse type for --resolve-threshold: a similarity in (0, 1]."""
+    threshold = float(value)
+    if not 0 < threshold <= 1:
+        raise argparse.ArgumentTypeError(f"must be greater than 0 and at most 1, got {value}")
+    return threshold
+
+def resolve_inferred_nodes(output_data, db, threshold=RESOLVE_THRESHOLD):
+    """
+    Merges Inferred nodes that name the same person, in place. A name joins
+    a Knowledge Base entry (by its name or aliases, never its keywords) or
+    an earlier inferred node when both the whole names and their last words
+    are within threshold edit similarity, and a bare inferred surname
+    ("Schiller") joins the one inferred full name ending in it ("Friedrich
+    Schiller"). Clusters that reach the Knowledge Base fold into that entry;
+    otherwise the fullest name with the most episodes is kept. Returns the
+    number of nodes merged away.
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+    inferred = [key for key, data in output_data.items() if data['category'] == 'Inferred']
+    forms = {key: entity_form(output_data[key]['name'] or "") for key in inferred}
+    parent = {}
+
+    def find(key):
+        while parent.get(key, key) != key:
+            parent[key] = parent.get(parent[key], parent[key])
+            key = parent[key]
+        return key
+
+    def union(a, b):
+        ra, rb = find(a), find(b)
+        if ra == rb or (ra in db and rb in db):
+            return
+        if rb in db:
+            ra, rb = rb, ra
+        parent[rb] = ra
+
+    # Keywords also name works and themes, so only names and person aliases are matched
+    index = NameIndex()
+    for key, info in db.items():
+        for name in [info['name']] + info.get('aliases', []):
+            form = entity_form(name)
+            if len(form) >= RESOLVE_MIN_LENGTH:
+                index.add(form, key)
+    surnames = defaultdict(set)
+
+    # Each name is compared with the KB and the inferred names before it, so every pair is seen once
+    for key in inferred:
+        form = forms[key]
+        if len(form) < RESOLVE_MIN_LENGTH:
+            continue
+        matches = {owner for _, owner in index.candidates(form, threshold)}
+        kb_matches = {owner for owner in matches if owner in db}
+        if len(kb_matches) == 1:
+            union(kb_matches.pop(), key)
+        elif not kb_matches:
+            for owner in matches:
+                union(owner, key)
+        index.add(form, key)
+        if " " in form:
+            surnames[last_word(form)].add(key)
+
+    # Bare surnames, once all full names are known, and only when they are unambiguous
+    for key in inferred:
+        form = forms[key]
+        if len(form) >= RESOLVE_MIN_LENGTH and " " not in form:
+            roots = {find(owner) for owner in surnames.get(form, ())}
+            if len(roots) == 1:
+                union(roots.pop(), key)
+
+    clusters = defaultdict(list)
+    for position, key in enumerate(inferred):
+        clusters[find(key)].append((position, key))
+    merged = 0
+    for root, members in clusters.items():
+        if root not in db and len(members) == 1:
+            continue
+        if root in db:
+            target = root
+        else:
+            # Prefer the fullest name, then one without honorifics, then the most episodes
+            _, target = max(members, key=lambda m: (
+                len(forms[m[1]].split()), -len(output_data[m[1]]['name'].split()),
+                len(output_data[m[1]]['episodes']), -m[0]))
+        episodes = output_data[target]['episodes']
+        for _, key in members:
+            if key != target:
+                episodes.extend(output_data.pop(key)['episodes'])
+                merged += 1
+        episodes.sort_newest_first()
+
+    if merged:
+        print(f"Merged {merged} duplicate inferred nodes.")
+    return merged
+
+# --- GRAPH INDEXES ---
+def find_dependency_cycles(db):
+    """Returns each dependency cycle in the knowledge base as a list of keys (first key repeated at the end)."""
+    cycles = []
+    state = {}  # key -> "visiting" | "done"
+    for root in db:
+        if root in state:
+            continue
+        path = [root]
+        state[root] = "visiting"
+        iterators = [iter(db[root]['deps'])]
+        while iterators:
+            dep = next(iterators[-1], None)
+            if dep is None:
+                state[path.pop()] = "done"
+                iterators.pop()
+            elif dep not in db or state.get(dep) == "done":
+                continue
+            elif state.get(dep) == "visiting":
+                cycles.append(path[path.index(dep):] + [dep])
+            else:
+                state[dep] = "visiting"
+                path.append(dep)
+                iterators.append(iter(db[dep]['deps']))
+    return cycles
+
+def build_graph_index(json_data):
+    """
+    Precomputes the page's graph queries over node positions in json_data:
+    deps (forward adjacency), rdeps (who builds on a node), order (a topological
+    "learning path" order, prerequisites first) and ancestors (every transitive
+    prerequisite of a node, listed in that order). Cycles are broken by position.
+    """
+    index = {node['id']: i for i, node in enumerate(json_data)}
+    deps = [sorted({index[dep] for dep in node['dependencies'] if dep in index and dep != node['id']}) for node in json_data]
+    rdeps = [[] for _ in json_data]
+    for i, targets in enumerate(deps):
+        for j in targets:
+            rdeps[j].append(i)
+
+    # Kahn's algorithm; whatever is left sits on a cycle and goes last
+    remaining = [len(targets) for targets in deps]
+    ready = [i for i, count in enumerate(remaining) if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        i = heapq.heappop(ready)
+        order.append(i)
+        for j in rdeps[i]:
+            remaining[j] -= 1
+            if remaining[j] == 0:
+                heapq.heappush(ready, j)
+    placed = set(order)
+    order.extend(i for i in range(len(json_data)) if i not in placed)
+    rank = {i: r for r, i in enumerate(order)}
+
+    ancestors = []
+    for i in range(len(json_data)):
+        seen = set()
+        stack = list(deps[i])
+        while stack:
+            j = stack.pop()
+            if j != i and j not in seen:
+                seen.add(j)
+                stack.extend(deps[j])
+        ancestors.append(sorted(seen, key=rank.get))
+
+    return {"deps": deps, "rdeps": rdeps, "order": order, "ancestors": ancestors}
+
+# --- LAYOUT ---
+# Same forces the page uses for its live d3 simulation
+LAYOUT_LINK_DISTANCE = 100
+LAYOUT_CHARGE = -400
+LAYOUT_COLLIDE_RADIUS = 30
+
+def compute_layout(json_data, iterations=300, seed=42, block_size=512):
+    """
+    Runs the page's force simulation ahead of time with NumPy and stores x/y on
+    each node (centered on 0,0). Nodes are seeded in id order, so the same graph
+    always gets the same layout. Pairwise forces are computed in row blocks to
+    keep memory bounded on large graphs.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required to precompute the layout")
+
+    ids = sorted(node['id'] for node in json_data)
+    n = len(ids)
+    if n == 0:
+        return json_data
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    edges = [(index[node['id']], index[dep]) for node in json_data for dep in node['dependencies'] if dep in index]
+    src = np.array([e[0] for e in edges], dtype=np.intp)
+    dst = np.array([e[1] for e in edges], dtype=np.intp)
+
+    # Phyllotaxis start like d3, plus seeded jitter so no two nodes coincide
+    rng = np.random.default_rng(seed)
+    i = np.arange(n)
+    radius = 10 * np.sqrt(0.5 + i)
+    angle = i * np.pi * (3 - np.sqrt(5))
+    pos = np.column_stack([radius * np.cos(angle), radius * np.sin(angle)]) + rng.uniform(-1e-3, 1e-3, (n, 2))
+    vel = np.zeros((n, 2))
+
+    degree = np.bincount(np.concatenate([src, dst]), minlength=n).astype(float)
+    if len(edges):
+        link_strength = 1 / np.minimum(degree[src], degree[dst])
+        bias = (degree[src] / (degree[src] + degree[dst]))[:, None]
+
+    alpha, alpha_min, velocity_decay = 1.0, 0.001, 0.6
+    alpha_decay = 1 - alpha_min ** (1 / iterations)
+    min_dist = 2 * LAYOUT_COLLIDE_RADIUS
+
+    for _ in range(iterations):
+        alpha += -alpha * alpha_decay
+
+        if len(edges):
+            delta = (pos[dst] + vel[dst]) - (pos[src] + vel[src])
+            length = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-6)
+            delta *= ((length - LAYOUT_LINK_DISTANCE) / length * alpha * link_strength)[:, None]
+            np.subtract.at(vel, dst, delta * bias)
+            np.add.at(vel, src, delta * (1 - bias))
+
+        x, y = pos[:, 0], pos[:, 1]
+        px, py = x + vel[:, 0], y + vel[:, 1]
+        for start in range(0, n, block_size):
+            rows = slice(start, start + block_size)
+            diag = (np.arange(min(block_size, n - start)), np.arange(start, min(start + block_size, n)))
+
+            dx = x[None, :] - x[rows, None]  # other - self
+            dy = y[None, :] - y[rows, None]
+            dist2 = dx * dx + dy * dy
+            dist2[diag] = np.inf
+            w = LAYOUT_CHARGE * alpha / np.maximum(dist2, 1)
+            charge_x, charge_y = (w * dx).sum(axis=1), (w * dy).sum(axis=1)
+
+            # Collision uses predicted positions, split evenly between the pair
+            dx = px[rows, None] - px[None, :]  # self - other
+            dy = py[rows, None] - py[None, :]
+            dist = np.sqrt(dx * dx + dy * dy)
+            dist[diag] = min_dist
+            overlap = np.where(dist < min_dist, (min_dist - dist) / np.maximum(dist, 1e-6) * 0.5, 0)
+
+            vel[rows, 0] += charge_x + (overlap * dx).sum(axis=1)
+            vel[rows, 1] += charge_y + (overlap * dy).sum(axis=1)
+
+        vel *= velocity_decay
+        pos += vel
+        pos -= pos.mean(axis=0)
+
+    for node in json_data:
+        x, y = pos[index[node['id']]]
+        node['x'], node['y'] = round(float(x), 1), round(float(y), 1)
+    return json_data
+
+# --- SEARCH INDEX ---
+SEARCH_TOKEN_RE = re.compile(r"\w+")
+
+def build_search_index(json_data, keyword_sources=None):
+    """
+    Inverted index for the page's search box: sorted tokens from node names,
+    knowledge base keywords and episode titles, each with the positions of the
+    nodes it occurs in. Sorted tokens let the page answer prefix queries with a
+    binary search.
+    """
+    keyword_sources = keyword_sources or (KNOWLEDGE_BASE, TOPIC_BUCKETS)
+    postings = defaultdict(set)
+    for i, node in enumerate(json_data):
+        texts = [node['name'] or node['id']]
+        for source in keyword_sources:
+            texts.extend(source.get(node['id'], {}).get('keywords', []))
+        texts.extend(node['episodes'].column('title'))
+        for text in texts:
+            for token in SEARCH_TOKEN_RE.findall(normalize(text)):
+                if len(token) > 1:
+                    postings[token].add(i)
+    tokens = sorted(postings)
+    return {"tokens": tokens, "postings": [sorted(postings[token]) for token in tokens]}
+
+# Page renderers. Both see the shared page state (nodes, links, nodeLit,
+# linkLit, radius, drag helpers, showDetails) and define `renderer`.
+SVG_RENDERER_JS = """
+    // --- SVG renderer: one DOM group per node and one line per link ---
+    const zoom = d3.zoom().on("zoom", (event) => {
+        g.attr("transform", event.transform);
+    });
+
+    const svg = d3.select("#graph-area").append("svg")
+        .attr("width", width)
+        .attr("height", height)
+        .call(zoom);
+
+    const g = svg.append("g");
+
+    svg.append("defs").selectAll("marker")
+        .data(["arrow"])
+        .enter().append("marker")
+        .attr("id", d => d)
+        .attr("viewBox", "0 -5 10 10")
+        .attr("refX", 25)
+        .attr("refY", 0)
+        .attr("markerWidth", 6)
+        .attr("markerHeight", 6)
+        .attr("orient", "auto")
+        .append("path")
+        .attr("d", "M0,-5L10,0L0,5")
+        .attr("fill", "#555");
+
+    const link = g.append("g")
+        .attr("class", "links")
+        .selectAll("line")
+        .data(links)
+        .enter().append("line")
+        .attr("class", "link");
+
+    const node = g.append("g")
+        .attr("class", "nodes")
+        .selectAll("g")
+        .data(nodes)
+        .enter().append("g")
+        .attr("class", "node")
+        .call(d3.drag()
+            .on("start", dragStart)
+            .on("drag", (event, d) => dragMove(d, event.x, event.y))
+            .on("end", dragEnd));
+
+    node.append("circle")
+        .attr("r", radius)
+        .attr("class", d => "cat-" + d.category.replace(/ /g, "_").replace(/&/g,""));
 
     node.append("text")
         .attr("dy", -10)
         .attr("text-anchor", "middle")
         .text(d => d.name);
 
-    node.on("click", (event, d) => {{ showDetails(d); }});
+    node.on("click", (event, d) => { showDetails(d); });
+
+    const nodeEls = node.nodes();
+    const linkEls = link.nodes();
+
+    const renderer = {
+        draw() {
+            link.attr("x1", d => d.source.x).attr("y1", d => d.source.y)
+                .attr("x2", d => d.target.x).attr("y2", d => d.target.y);
+            node.attr("transform", d => `translate(${d.x},${d.y})`);
+        },
+        restyle(nodeIdxs, linkIdxs) {
+            nodeIdxs.forEach(i => { nodeEls[i].style.opacity = nodeLit[i] ? 1 : 0.1; });
+            linkIdxs.forEach(i => { linkEls[i].style.opacity = linkLit[i] ? 1 : 0.1; });
+        },
+        centerOn(d) {
+            const k = d3.zoomTransform(svg.node()).k;
+            svg.transition().duration(500).call(zoom.transform,
+                d3.zoomIdentity.translate(width / 2 - d.x * k, height / 2 - d.y * k).scale(k));
+        },
+    };
+"""
+
+CANVAS_RENDERER_JS = """
+    // --- Canvas renderer: everything is painted onto one <canvas>. Off-screen
+    // nodes and links are skipped, labels and arrowheads are only drawn once
+    // zoomed in, and clicks/drags are hit-tested through a quadtree. ---
+    const LABEL_MIN_ZOOM = 0.8;
+    const MAX_RADIUS = 20;
+
+    // Keep in sync with the .cat-* rules in the stylesheet
+    const categoryColors = {
+        "Ancient": "#ff9f43", "Medieval": "#feca57", "Modern": "#ff6b6b", "19th Century": "#ff9ff3",
+        "Analytic": "#54a0ff", "Continental": "#00d2d3", "Phenomenology": "#1dd1a1", "Existentialism": "#10ac84",
+        "Eastern": "#5f27cd", "Topic": "#c8d6e5", "Literature": "#8395a7", "Inferred": "#a55eea", "Other": "#777",
+    };
+
+    const dpr = window.devicePixelRatio || 1;
+    const canvas = d3.select("#graph-area").append("canvas")
+        .attr("width", width * dpr)
+        .attr("height", height * dpr)
+        .style("width", width + "px")
+        .style("height", height + "px")
+        .style("display", "block");
+    const ctx = canvas.node().getContext("2d");
+
+    let transform = d3.zoomIdentity;
+    let quadtree = null;
+    let frame = null;
+
+    function findNode(px, py) {
+        if (!quadtree) quadtree = d3.quadtree().x(d => d.x).y(d => d.y).addAll(nodes);
+        const [x, y] = transform.invert([px, py]);
+        const slack = 4 / transform.k;
+        const d = quadtree.find(x, y, MAX_RADIUS + slack);
+        return d && Math.hypot(d.x - x, d.y - y) <= radius(d) + slack ? d : undefined;
+    }
+
+    function paint() {
+        frame = null;
+        quadtree = null; // positions may have changed since the last hit-test
+        const k = transform.k;
+        const [x0, y0] = transform.invert([0, 0]);
+        const [x1, y1] = transform.invert([width, height]);
+        const pad = MAX_RADIUS + 40;
+        const onScreen = d => d.x > x0 - pad && d.x < x1 + pad && d.y > y0 - pad && d.y < y1 + pad;
+        const detailed = k >= LABEL_MIN_ZOOM;
+
+        ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+        ctx.clearRect(0, 0, width, height);
+        ctx.translate(transform.x, transform.y);
+        ctx.scale(k, k);
+
+        // Links, batched into one path per highlight state
+        ctx.strokeStyle = "#555";
+        ctx.lineWidth = 1;
+        [true, false].forEach(lit => {
+            ctx.globalAlpha = lit ? 0.6 : 0.06;
+            ctx.beginPath();
+            links.forEach((l, i) => {
+                const s = l.source, t = l.target;
+                if (linkLit[i] !== lit) return;
+                if (Math.max(s.x, t.x) < x0 || Math.min(s.x, t.x) > x1 || Math.max(s.y, t.y) < y0 || Math.min(s.y, t.y) > y1) return;
+                ctx.moveTo(s.x, s.y);
+                ctx.lineTo(t.x, t.y);
+                if (detailed) {
+                    const len = Math.hypot(t.x - s.x, t.y - s.y) || 1;
+                    const ux = (t.x - s.x) / len, uy = (t.y - s.y) / len;
+                    const tipX = t.x - ux * (radius(t) + 2), tipY = t.y - uy * (radius(t) + 2);
+                    ctx.moveTo(tipX - ux * 6 - uy * 3, tipY - uy * 6 + ux * 3);
+                    ctx.lineTo(tipX, tipY);
+                    ctx.lineTo(tipX - ux * 6 + uy * 3, tipY - uy * 6 - ux * 3);
+                }
+            });
+            ctx.stroke();
+        });
+
+        ctx.strokeStyle = "#fff";
+        ctx.lineWidth = 1.5;
+        nodes.forEach((d, i) => {
+            if (!onScreen(d)) return;
+            ctx.globalAlpha = nodeLit[i] ? 1 : 0.1;
+            ctx.beginPath();
+            ctx.arc(d.x, d.y, radius(d), 0, 2 * Math.PI);
+            ctx.fillStyle = categoryColors[d.category] || "#000";
+            ctx.fill();
+            ctx.stroke();
+        });
+
+        if (detailed) {
+            ctx.font = "10px sans-serif";
+            ctx.textAlign = "center";
+            ctx.fillStyle = "#eee";
+            nodes.forEach((d, i) => {
+                if (!onScreen(d)) return;
+                ctx.globalAlpha = nodeLit[i] ? 1 : 0.1;
+                ctx.fillText(d.name, d.x, d.y - 10);
+            });
+        }
+        ctx.globalAlpha = 1;
+    }
+
+    const zoom = d3.zoom().on("zoom", (event) => {
+        transform = event.transform;
+        renderer.draw();
+    });
+
+    // Drag is registered first so it claims gestures that start on a node; the rest pan/zoom
+    canvas
+        .call(d3.drag()
+            .container(canvas.node())
+            .subject(event => findNode(event.x, event.y))
+            .on("start", event => dragStart(event, event.subject))
+            .on("drag", event => {
+                const [x, y] = transform.invert(d3.pointer(event, canvas.node()));
+                dragMove(event.subject, x, y);
+            })
+            .on("end", event => dragEnd(event, event.subject)))
+        .call(zoom)
+        .on("click", (event) => {
+            const d = findNode(...d3.pointer(event));
+            if (d) showDetails(d);
+        })
+        .on("mousemove", (event) => {
+            canvas.style("cursor", findNode(...d3.pointer(event)) ? "pointer" : null);
+        });
+
+    const renderer = {
+        draw() {
+            if (!frame) frame = requestAnimationFrame(paint);
+        },
+        restyle() {
+            renderer.draw();
+        },
+        centerOn(d) {
+            const k = transform.k;
+            canvas.transition().duration(500).call(zoom.transform,
+                d3.zoomIdentity.translate(width / 2 - d.x * k, height / 2 - d.y * k).scale(k));
+        },
+    };
+"""
+
+RENDERERS = {"svg": SVG_RENDERER_JS, "canvas": CANVAS_RENDERER_JS}
+
+# Episode fields the page actually renders; the rest stay server-side.
+PAGE_EPISODE_FIELDS = ("title", "link", "pub_date")
+PAGE_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+def page_date(pub_date):
+    """YYYY-MM-DD of an ISO pub_date, or "" if it is missing or wasn't parsed."""
+    return pub_date[:10] if pub_date and PAGE_DATE_RE.match(pub_date) else ""
+
+def page_episodes(node):
+    """
+    The node's episodes as compact [title, link, date] rows, newest first and
+    undated last, so the page can slice a date range out with binary search.
+    """
+    rows = node['episodes'].values(PAGE_EPISODE_FIELDS)
+    for row in rows:
+        row[2] = page_date(row[2])
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows
+
+SHARD_NAME_RE = re.compile(r"^(\d+\.json)(\.gz|\.br)?$")
+
+def write_episode_shards(json_data, shard_dir, hashed=False, page_dir=".", shard_paths=None):
+    """
+    Writes one minified JSON array per node into shard_dir and returns the
+    graph skeleton that points at them, by URLs relative to page_dir. Shards
+    are named by node position since inferred ids can contain anything, or by
+    content hash when hashed (old hashed shards are kept, like other
+    immutable assets). The files written are added to shard_paths.
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    skeleton = []
+    written = set()
+    for i, node in enumerate(json_data):
+        content = json.dumps(page_episodes(node), separators=(",", ":"))
+        file_name = f"{content_hash(content)}.json" if hashed else f"{i}.json"
+        write_if_changed(os.path.join(shard_dir, file_name), content)
+        if shard_paths is not None and file_name not in written:
+            shard_paths.append(os.path.join(shard_dir, file_name))
+        written.add(file_name)
+        entry = {k: v for k, v in node.items() if k != 'episodes'}
+        entry['episode_count'] = len(node['episodes'])
+        entry['shard'] = url_path(page_dir, shard_dir, file_name)
+        skeleton.append(entry)
+
+    # Drop shards left over from a run with more nodes, and nothing else in the directory
+    if not hashed:
+        for file_name in os.listdir(shard_dir):
+            match = SHARD_NAME_RE.match(file_name)
+            if match and match[1] not in written:
+                os.remove(os.path.join(shard_dir, file_name))
+    return skeleton
+
+def iter_json_array(items, indent=None):
+    """
+    Encodes an iterable as a JSON array one item at a time, with the same
+    output as json.dumps(list(items), indent=indent), so only one item's
+    encoding is ever in memory.
+    """
+    encoder = json.JSONEncoder(indent=indent, separators=(",", ": ") if indent else (",", ":"))
+    pad = "\n" + " " * (indent or 0)
+    first = True
+    for item in items:
+        text = encoder.encode(item)
+        if indent:
+            # JSON strings never hold raw newlines, so re-indenting line starts is safe
+            text = pad + text.replace("\n", pad)
+        yield ("[" if first else ",") + text
+        first = False
+    yield "[]" if first else ("\n]" if indent else "]")
+
+def iter_page_data(json_data, shard_dir=None, hashed=False, minify=False, shard_paths=None, page_dir=".", db=None):
+    """
+    Yields the page's data script (rawData, searchIndex, graphIndex) in chunks,
+    one node at a time. The shards it writes are added to shard_paths, and the
+    search index takes its keywords from db (default: KNOWLEDGE_BASE).
+    """
+    if shard_dir:
+        nodes = write_episode_shards(json_data, shard_dir, hashed=hashed, page_dir=page_dir, shard_paths=shard_paths)
+        indent = None
+    else:
+        nodes = ({**node, "episode_count": len(node['episodes']), "episodes": page_episodes(node)} for node in json_data)
+        indent = None if minify else 2
+    compact = json.JSONEncoder(separators=(",", ":"))
+    newline = "\n" if minify else "\n    "
+    yield "const rawData = " if minify else "\n    const rawData = "
+    yield from iter_json_array(nodes, indent)
+    yield f";{newline}const searchIndex = "
+    yield compact.encode(build_search_index(json_data, (db or KNOWLEDGE_BASE, TOPIC_BUCKETS)))
+    if not minify:
+        yield ";\n    // Prebuilt adjacency by node position: deps, rdeps, ancestors (learning path order)"
+    yield f";{newline}const graphIndex = " if minify else "\n    const graphIndex = "
+    yield compact.encode(build_graph_index(json_data))
+    yield ";" if minify else ";\n"
+
+def generate_html(json_data, shard_dir=None, renderer="svg", asset_dir=None, live_reload=None, minify=False,
+                  out="index.html", db=None):
+    """
+    Generates the Single Page App. With shard_dir set, only a minified graph
+    skeleton is inlined and each node's episodes are fetched when opened.
+    renderer picks "svg" (DOM per node) or "canvas" (scales to thousands of nodes).
+    With asset_dir set, the data and script go to content-hashed files there
+    (shards too) and the page is just a small shell; see write_hashed_assets.
+    live_reload is the build number under --watch; the page then reloads
+    itself when the dev server announces a newer one. minify strips the
+    CSS, JS and JSON down for production. db is the knowledge base the nodes
+    came from, for search keywords (default: KNOWLEDGE_BASE).
+
+    The page is streamed, node by node, into out: a path (left untouched if
+    its content hasn't changed) or a text or binary file object such as a
+    pipe. Returns the paths of every file that makes up the page.
+    """
+
+    renderer_js = RENDERERS[renderer]
+
+    app_js = f"""
+    const nodes = rawData.map(d => ({{ ...d }}));
+    const nodeMap = new Map(nodes.map(n => [n.id, n]));
+    const links = [];
+    graphIndex.deps.forEach((targets, i) => {{
+        targets.forEach(j => links.push({{ source: nodes[i], target: nodes[j] }}));
+    }});
+
+    const width = document.getElementById('graph-area').clientWidth;
+    const height = document.getElementById('graph-area').clientHeight;
+
+    // Builds run with --layout ship fixed positions; the live simulation is then opt-in
+    const precomputed = nodes.length > 0 && nodes.every(n => n.x !== undefined);
+    if (precomputed) {{
+        nodes.forEach(n => {{ n.x += width / 2; n.y += height / 2; }});
+        document.getElementById("live-toggle").style.display = "block";
+    }}
+
+    let simulation = null;
+
+    function startSimulation() {{
+        simulation = d3.forceSimulation(nodes)
+            .force("link", d3.forceLink(links).id(d => d.id).distance(100))
+            .force("charge", d3.forceManyBody().strength(-400))
+            .force("center", d3.forceCenter(width / 2, height / 2))
+            .force("collide", d3.forceCollide(30))
+            .on("tick", () => renderer.draw());
+        if (precomputed) simulation.alpha(0.3);
+    }}
+
+    function stopSimulation() {{
+        if (simulation) simulation.stop();
+        simulation = null;
+    }}
+
+    // Without a running simulation, dragging just moves the node and redraws
+    function dragStart(event, d) {{ if (simulation && !event.active) simulation.alphaTarget(0.3).restart(); d.fx = d.x; d.fy = d.y; }}
+    function dragMove(d, x, y) {{
+        d.fx = x; d.fy = y;
+        if (!simulation) {{ d.x = x; d.y = y; renderer.draw(); }}
+    }}
+    function dragEnd(event, d) {{ if (simulation && !event.active) simulation.alphaTarget(0); d.fx = null; d.fy = null; }}
+
+    const radius = d => 5 + (Math.min(d.episode_count, 10) * 1.5);
 
+    // Search highlight state, shared with the renderer
+    const nodeIndex = new Map(nodes.map((n, i) => [n.id, i]));
+    const linksByNode = nodes.map(() => []);
+    links.forEach((l, i) => {{
+        linksByNode[nodeIndex.get(l.source.id)].push(i);
+        linksByNode[nodeIndex.get(l.target.id)].push(i);
+    }});
+    const nodeLit = nodes.map(() => true);
+    const linkLit = links.map(() => true);
+
+    // The renderer exposes draw() after positions move, restyle(nodeIdxs, linkIdxs)
+    // after highlight changes, and centerOn(node).
+{renderer_js}
     function showDetails(d) {{
         const details = document.getElementById("details");
         let html = `<h2>${{d.name}}</h2>`;
@@ -482,52 +2025,840 @@ def generate_html(json_data):
             html += `</div>`;
         }}
 
-        html += `<h3>Episodes (${{d.episodes.length}})</h3>`;
-        d.episodes.forEach(ep => {{
-            html += `<a href="${{ep.link}}" target="_blank" class="episode-link">${{ep.title}}</a>`;
-        }});
+        const i = nodeIndex.get(d.id);
+        html += nodeList("Listen first (learning path)", graphIndex.ancestors[i]);
+        html += nodeList("Builds on this", graphIndex.rdeps[i]);
+
+        html += `<h3>Episodes (<span id="episode-count">${{d.episode_count}}</span>)</h3>`;
+        html += `<div class="episode-tools"><button id="episode-order">Newest first</button>` +
+            `<input type="date" id="episode-from" title="From"><input type="date" id="episode-to" title="To"></div>`;
+        html += `<div id="episode-list"><div id="episode-rows">${{d.episodes ? "" : "<p><i>Loading episodes...</i></p>"}}</div></div>`;
 
         details.innerHTML = html;
+        shownId = d.id;
+        episodeView = null;
+
+        document.getElementById("episode-list").addEventListener("scroll", () => {{
+            if (!episodeFrame) episodeFrame = requestAnimationFrame(renderEpisodes);
+        }});
+        document.getElementById("episode-from").addEventListener("change", filterEpisodes);
+        document.getElementById("episode-to").addEventListener("change", filterEpisodes);
+        document.getElementById("episode-order").addEventListener("click", e => {{
+            if (!episodeView) return;
+            episodeView.newestFirst = !episodeView.newestFirst;
+            e.target.textContent = episodeView.newestFirst ? "Newest first" : "Oldest first";
+            document.getElementById("episode-list").scrollTop = 0;
+            renderEpisodes();
+        }});
+
+        loadEpisodes(d).then(rows => {{
+            if (shownId !== d.id) return; // another node was opened meanwhile
+            episodeView = {{ rows, start: 0, end: rows.length, newestFirst: true }};
+            filterEpisodes();
+        }}).catch(() => {{
+            if (shownId === d.id) document.getElementById("episode-rows").innerHTML = "<p><i>Could not load episodes.</i></p>";
+        }});
+    }}
+
+    // --- Episode list: rows arrive as [title, link, date], newest first, and only
+    // the ones scrolled into view are in the DOM, so opening a node costs the same
+    // whatever its episode count. A date range is one slice, found by binary search,
+    // and oldest first just walks that slice backwards. ---
+    const EPISODE_ROW_HEIGHT = 34; // Keep in sync with .episode-link (height plus gap)
+    const EPISODE_OVERSCAN = 8;
+    let episodeView = null;
+    let episodeFrame = null;
+
+    function escapeHtml(text) {{
+        return String(text).replace(/[&<>"']/g, c => `&#${{c.charCodeAt(0)}};`);
+    }}
+
+    // Index of the first row dated before `date` (undated rows sort as "")
+    function firstOlder(rows, date) {{
+        let lo = 0, hi = rows.length;
+        while (lo < hi) {{
+            const mid = (lo + hi) >> 1;
+            if (rows[mid][2] >= date) lo = mid + 1; else hi = mid;
+        }}
+        return lo;
+    }}
+
+    function filterEpisodes() {{
+        const v = episodeView;
+        if (!v) return;
+        const from = document.getElementById("episode-from").value;
+        const to = document.getElementById("episode-to").value;
+        // Any bound drops undated episodes; "\\uffff" keeps the whole `to` day
+        v.start = to ? firstOlder(v.rows, to + "\\uffff") : 0;
+        v.end = Math.max(v.start, firstOlder(v.rows, from || (to ? "0" : "")));
+        const shown = v.end - v.start;
+        document.getElementById("episode-count").textContent = shown === v.rows.length ? shown : `${{shown}} of ${{v.rows.length}}`;
+        document.getElementById("episode-list").scrollTop = 0;
+        renderEpisodes();
+    }}
+
+    function renderEpisodes() {{
+        episodeFrame = null;
+        const v = episodeView;
+        const list = document.getElementById("episode-list");
+        if (!v || !list) return;
+        const count = v.end - v.start;
+        const first = Math.max(0, Math.floor(list.scrollTop / EPISODE_ROW_HEIGHT) - EPISODE_OVERSCAN);
+        const last = Math.min(count, Math.ceil((list.scrollTop + list.clientHeight) / EPISODE_ROW_HEIGHT) + EPISODE_OVERSCAN);
+        let html = "";
+        for (let k = first; k < last; k++) {{
+            const [title, link, date] = v.rows[v.newestFirst ? v.start + k : v.end - 1 - k];
+            html += `<a href="${{escapeHtml(link)}}" target="_blank" class="episode-link" style="top:${{k * EPISODE_ROW_HEIGHT}}px" title="${{escapeHtml(title)}}">` +
+                `<span class="episode-date">${{date}}</span>${{escapeHtml(title)}}</a>`;
+        }}
+        const rowsEl = document.getElementById("episode-rows");
+        rowsEl.style.height = `${{count * EPISODE_ROW_HEIGHT}}px`;
+        rowsEl.innerHTML = count ? html : "<p><i>No episodes in this range.</i></p>";
+    }}
+
+    function nodeList(title, idxs) {{
+        if (!idxs.length) return "";
+        return `<div class="dependency-list"><strong>${{title}}:</strong><br>` +
+            idxs.map(j => `<span class="dep-item" onclick="clickNode('${{nodes[j].id}}')">${{nodes[j].name}}</span>`).join("; ") +
+            `</div>`;
+    }}
+
+    // Episodes are inlined in the default build, or fetched per node from shards
+    let shownId = null;
+    const episodeCache = new Map();
+
+    function loadEpisodes(d) {{
+        if (d.episodes) return Promise.resolve(d.episodes);
+        if (!episodeCache.has(d.id)) {{
+            episodeCache.set(d.id, fetch(d.shard).then(r => {{
+                if (!r.ok) throw new Error(r.statusText);
+                return r.json();
+            }}));
+        }}
+        return episodeCache.get(d.id);
     }}
     
     window.clickNode = function(id) {{
-        const target = nodes.find(n => n.id === id);
+        const target = nodeMap.get(id);
         if (target) showDetails(target);
     }};
 
-    document.getElementById("search").addEventListener("input", function(e) {{
-        const term = e.target.value.toLowerCase();
-        node.style("opacity", d => d.name.toLowerCase().includes(term) ? 1 : 0.1);
-        link.style("opacity", d => (d.source.name.toLowerCase().includes(term) || d.target.name.toLowerCase().includes(term)) ? 1 : 0.1);
+    // --- Search: prefix lookups against the prebuilt index, restyling only what changed ---
+    function lowerBound(word) {{
+        let lo = 0, hi = searchIndex.tokens.length;
+        while (lo < hi) {{
+            const mid = (lo + hi) >> 1;
+            if (searchIndex.tokens[mid] < word) lo = mid + 1; else hi = mid;
+        }}
+        return lo;
+    }}
+
+    // Node positions matching every word of the query (as a prefix), or null for "no filter"
+    function lookup(term) {{
+        const words = term.toLowerCase().match(/[\\p{{L}}\\p{{N}}_]+/gu);
+        if (!words) return null;
+        let result = null;
+        for (const word of words) {{
+            const hits = new Set();
+            for (let i = lowerBound(word); i < searchIndex.tokens.length && searchIndex.tokens[i].startsWith(word); i++) {{
+                searchIndex.postings[i].forEach(n => hits.add(n));
+            }}
+            result = result === null ? hits : new Set([...result].filter(n => hits.has(n)));
+            if (result.size === 0) break;
+        }}
+        return result;
+    }}
+
+    // Name matches beat episode-title matches, then bigger nodes win
+    function bestMatch(matches, term) {{
+        const words = term.toLowerCase().split(/\\s+/).filter(Boolean);
+        let best = null, bestScore = -1;
+        matches.forEach(i => {{
+            const n = nodes[i];
+            const name = n.name.toLowerCase();
+            const score = words.filter(w => name.includes(w)).length * 1e6 + n.episode_count;
+            if (score > bestScore) {{ best = n; bestScore = score; }}
+        }});
+        return best;
+    }}
+
+    function applySearch(matches) {{
+        const changedNodes = [];
+        const dirtyLinks = new Set();
+        nodes.forEach((n, i) => {{
+            const lit = matches === null || matches.has(i);
+            if (lit !== nodeLit[i]) {{
+                nodeLit[i] = lit;
+                changedNodes.push(i);
+                linksByNode[i].forEach(l => dirtyLinks.add(l));
+            }}
+        }});
+        const changedLinks = [];
+        dirtyLinks.forEach(i => {{
+            const l = links[i];
+            const lit = nodeLit[nodeIndex.get(l.source.id)] || nodeLit[nodeIndex.get(l.target.id)];
+            if (lit !== linkLit[i]) {{
+                linkLit[i] = lit;
+                changedLinks.push(i);
+            }}
+        }});
+        if (changedNodes.length || changedLinks.length) renderer.restyle(changedNodes, changedLinks);
+    }}
+
+    function focusNode(d) {{
+        showDetails(d);
+        renderer.centerOn(d);
+    }}
+
+    let searchTimer = null;
+    const searchBox = document.getElementById("search");
+    searchBox.addEventListener("input", function(e) {{
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(() => applySearch(lookup(e.target.value)), 120);
+    }});
+    searchBox.addEventListener("keydown", function(e) {{
+        if (e.key !== "Enter") return;
+        clearTimeout(searchTimer);
+        const matches = lookup(e.target.value);
+        applySearch(matches);
+        if (matches && matches.size) focusNode(bestMatch(matches, e.target.value));
     }});
 
-    simulation.on("tick", () => {{
-        link.attr("x1", d => d.source.x).attr("y1", d => d.source.y)
-            .attr("x2", d => d.target.x).attr("y2", d => d.target.y);
-        node.attr("transform", d => `translate(${{d.x}},${{d.y}})`);
+    document.getElementById("live-layout").addEventListener("change", e => {{
+        if (e.target.checked) startSimulation(); else stopSimulation();
     }});
 
-    function dragstarted(event, d) {{ if (!event.active) simulation.alphaTarget(0.3).restart(); d.fx = d.x; d.fy = d.y; }}
-    function dragged(event, d) {{ d.fx = event.x; d.fy = event.y; }}
-    function dragended(event, d) {{ if (!event.active) simulation.alphaTarget(0); d.fx = null; d.fy = null; }}
-</script>
+    if (precomputed) renderer.draw(); else startSimulation();
+"""
+
+    if minify:
+        app_js = strip_lines(app_js)
+    # Shard and asset URLs are relative to the page; stdout pages are served from the working directory
+    page_dir = (os.path.dirname(out) or ".") if isinstance(out, (str, os.PathLike)) else "."
+    for directory in (shard_dir, asset_dir):
+        if directory:
+            page_relative(page_dir, directory)  # fail before writing anything
+    shard_paths = []
+    data_js = iter_page_data(json_data, shard_dir, hashed=bool(asset_dir), minify=minify, shard_paths=shard_paths,
+                             page_dir=page_dir, db=db)
+
+    if asset_dir:
+        manifest = write_hashed_assets(asset_dir, {"data.js": data_js, "app.js": app_js})
+        scripts = ["\n".join(f'<script src="{url_path(page_dir, asset_dir, manifest[name])}"></script>' for name in ("data.js", "app.js"))]
+    else:
+        scripts = ["<script>", data_js, app_js, "</script>"]
+    if live_reload is not None:
+        scripts.append(f'\n<script>new EventSource("{LIVE_RELOAD_PATH}?since={live_reload}").onmessage = () => location.reload();</script>')
+
+    page_head = f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Philosophy Podcast Mind Map</title>
+    <script src="https://d3js.org/d3.v7.min.js"></script>
+    <style>
+        body {{ font-family: 'Helvetica Neue', Arial, sans-serif; background-color: #1a1a1a; color: #f0f0f0; margin: 0; overflow: hidden; }}
+        #container {{ display: flex; height: 100vh; }}
+        #sidebar {{ width: 350px; background-color: #2c2c2c; padding: 20px; box-shadow: 2px 0 5px rgba(0,0,0,0.5); overflow-y: auto; z-index: 10; }}
+        #graph-area {{ flex-grow: 1; position: relative; }}
+        
+        h1 {{ font-size: 1.2em; color: #61dafb; margin-top: 0; }}
+        h2 {{ font-size: 1.5em; border-bottom: 1px solid #444; padding-bottom: 10px; }}
+        
+        #episode-list {{ max-height: 60vh; overflow-y: auto; margin-top: 8px; }}
+        #episode-rows {{ position: relative; }}
+        .episode-link {{ position: absolute; left: 0; right: 0; box-sizing: border-box; height: 30px; line-height: 20px; color: #ddd; text-decoration: none; padding: 5px; background: #3a3a3a; border-radius: 4px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }}
+        .episode-link:hover {{ background: #505050; color: #fff; }}
+        .episode-date {{ color: #888; font-size: 0.85em; margin-right: 6px; }}
+        .episode-tools {{ display: flex; gap: 6px; font-size: 0.85em; }}
+        .episode-tools input, .episode-tools button {{ background: #444; color: #eee; border: none; border-radius: 4px; padding: 4px; }}
+        
+        .sep-link {{ display: inline-block; margin-top: 10px; color: #ff6b6b; font-weight: bold; text-decoration: none; }}
+        .sep-link:hover {{ text-decoration: underline; }}
+
+        .search-container {{ margin-bottom: 20px; }}
+        input[type="text"] {{ width: 100%; padding: 10px; border-radius: 4px; border: none; background: #444; color: white; }}
+        
+        .node circle {{ stroke: #fff; stroke-width: 1.5px; cursor: pointer; transition: all 0.3s; }}
+        .node:hover circle {{ stroke: #61dafb; stroke-width: 3px; r: 25 !important; }}
+        .node text {{ font: 10px sans-serif; pointer-events: none; fill: #eee; text-shadow: 1px 1px 2px #000; }}
+        
+        .link {{ fill: none; stroke: #555; stroke-opacity: 0.6; marker-end: url(#arrow); }}
+        
+        /* Category Colors */
+        .cat-Ancient {{ fill: #ff9f43; }}
+        .cat-Medieval {{ fill: #feca57; }}
+        .cat-Modern {{ fill: #ff6b6b; }}
+        .cat-19th_Century {{ fill: #ff9ff3; }}
+        .cat-Analytic {{ fill: #54a0ff; }}
+        .cat-Continental {{ fill: #00d2d3; }}
+        .cat-Phenomenology {{ fill: #1dd1a1; }}
+        .cat-Existentialism {{ fill: #10ac84; }}
+        .cat-Eastern {{ fill: #5f27cd; }}
+        .cat-Topic {{ fill: #c8d6e5; }}
+        .cat-Literature {{ fill: #8395a7; }}
+        .cat-Inferred {{ fill: #a55eea; }} /* Purple for auto-discovered */
+        .cat-Other {{ fill: #777; }}
+
+        #dependency-list, .dependency-list {{ margin-top: 15px; font-size: 0.9em; color: #aaa; }}
+        .dep-item {{ color: #61dafb; cursor: pointer; }}
+        
+        .legend {{ position: absolute; bottom: 20px; right: 20px; background: rgba(0,0,0,0.7); padding: 10px; border-radius: 5px; font-size: 0.8em; }}
+        .legend-item {{ display: flex; align-items: center; margin: 2px 0; }}
+        .legend-color {{ width: 12px; height: 12px; margin-right: 5px; border-radius: 50%; }}
+    </style>
+</head>
+<body>
+
+<div id="container">
+    <div id="sidebar">
+        <h1>PEL Mind Map</h1>
+        <div class="search-container">
+            <input type="text" id="search" placeholder="Search philosopher, topic or episode...">
+            <label id="live-toggle" style="display:none; margin-top:8px; font-size:0.85em; color:#aaa;"><input type="checkbox" id="live-layout"> Live physics</label>
+        </div>
+        <div id="details">
+            <p><i>Click a node to view episodes and details.</i></p>
+        </div>
+    </div>
+    <div id="graph-area">
+        <div class="legend">
+            <div class="legend-item"><div class="legend-color" style="background:#ff9f43"></div>Ancient</div>
+            <div class="legend-item"><div class="legend-color" style="background:#ff6b6b"></div>Modern</div>
+            <div class="legend-item"><div class="legend-color" style="background:#00d2d3"></div>Continental</div>
+            <div class="legend-item"><div class="legend-color" style="background:#54a0ff"></div>Analytic</div>
+            <div class="legend-item"><div class="legend-color" style="background:#a55eea"></div>Inferred/Guest</div>
+        </div>
+    </div>
+</div>
+
+"""
+    page_tail = """
 
 </body>
 </html>
 """
-    
-    with open("index.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
-    print("Successfully created index.html")
+    if minify:
+        page_head, page_tail = minify_html(page_head) + "\n", "\n" + strip_lines(page_tail)
+    chunks = itertools.chain([page_head], *([chunk] if isinstance(chunk, str) else chunk for chunk in scripts), [page_tail])
 
-if __name__ == "__main__":
-    file_name = "pel.xml"
-    if not os.path.exists(file_name):
-        print(f"Error: {file_name} not found. Please verify the file path.")
+    paths = []
+    if isinstance(out, (str, os.PathLike)):
+        os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+        if write_if_changed(out, chunks):
+            print(f"Successfully created {out}")
+        else:
+            print(f"{out} is unchanged")
+        paths.append(out)
     else:
-        episodes = parse_rss_feed(file_name)
-        if episodes:
-            final_data = categorize_episodes(episodes, KNOWLEDGE_BASE)
-            generate_html(final_data)
+        binary = isinstance(out, (io.RawIOBase, io.BufferedIOBase))
+        for chunk in chunks:
+            out.write(chunk.encode("utf-8") if binary else chunk)
+        out.flush()
+
+    if asset_dir:
+        paths += [os.path.join(asset_dir, name) for name in ("manifest.json", manifest["data.js"], manifest["app.js"])]
+    return paths + shard_paths
+
+# --- PRODUCTION BUILD ---
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+CSS_SPACE_RE = re.compile(r"\s*([{}:;,>])\s*")
+STYLE_RE = re.compile(r"(<style>)(.*?)(</style>)", re.S)
+REPORT_GROUP_MIN = 10  # Directories with more files than this are summed up in the size report
+
+def minify_css(css):
+    css = CSS_SPACE_RE.sub(r"\1", " ".join(CSS_COMMENT_RE.sub("", css).split()))
+    return css.replace(";}", "}")
+
+def strip_lines(text):
+    """
+    Drops indentation, blank lines and whole-line // comments from JS or HTML.
+    Line breaks stay, so automatic semicolon insertion sees the same statements.
+    """
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+def minify_html(html):
+    return strip_lines(STYLE_RE.sub(lambda m: m[1] + minify_css(m[2]) + m[3], html))
+
+def compress_artifacts(paths):
+    """
+    Writes .gz (and, with brotli installed, .br) siblings at maximum
+    compression next to each file, for static hosts that serve precompressed
+    files. Siblings newer than their file are kept as they are. Returns
+    {path: (bytes, gzip bytes, brotli bytes or None)}.
+    """
+    compressors = [("gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        compressors.append(("br", lambda data: brotli.compress(data, quality=11)))
+    sizes = {}
+    for path in dict.fromkeys(paths):
+        with open(path, "rb") as f:
+            data = f.read()
+        row = [len(data)]
+        for ext, compress in compressors:
+            sibling = f"{path}.{ext}"
+            if not os.path.exists(sibling) or os.path.getmtime(sibling) < os.path.getmtime(path):
+                write_if_changed(sibling, compress(data))
+            row.append(os.path.getsize(sibling))
+        sizes[path] = tuple(row) if brotli is not None else (*row, None)
+    return sizes
+
+def print_size_report(sizes):
+    """Prints raw/gzip/brotli bytes per artifact, summing up directories full of shards."""
+    by_dir = defaultdict(list)
+    for path in sizes:
+        by_dir[os.path.dirname(path)].append(path)
+    rows = []
+    for directory, paths in by_dir.items():
+        if len(paths) > REPORT_GROUP_MIN:
+            total = [sum(sizes[p][i] or 0 for p in paths) for i in range(3)]
+            rows.append((f"{os.path.join(directory, '*')} ({len(paths)} files)", *total))
+        else:
+            rows.extend((path, *sizes[path]) for path in paths)
+    rows.append(("total", *(sum(row[i] or 0 for row in rows) for i in range(1, 4))))
+    width = max(len(row[0]) for row in rows)
+    print(f"{'artifact':<{width}}  {'bytes':>10}  {'gzip':>10}  {'brotli':>10}")
+    for name, raw, gz, br in rows:
+        print(f"{name:<{width}}  {raw:>10,}  {gz:>10,}  {br:>10,}" if brotli is not None
+              else f"{name:<{width}}  {raw:>10,}  {gz:>10,}  {'-':>10}")
+
+# --- WATCH MODE ---
+WATCH_INTERVAL = 0.5
+LIVE_RELOAD_PATH = "/__livereload"
+
+def load_knowledge_base(path):
+    """Reads the KNOWLEDGE_BASE literal out of a copy of this script without running it."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, "id", None) == "KNOWLEDGE_BASE" for target in node.targets):
+            return ast.literal_eval(node.value)
+    raise ValueError("KNOWLEDGE_BASE not found")
+
+def changed_keywords(old_db, new_db):
+    """
+    Keywords whose matches may differ between two knowledge bases: those of
+    added, removed or re-keyworded entries, and of entries whose priority
+    (dict order) moved relative to the others.
+    """
+    changed = set()
+    for key in old_db.keys() | new_db.keys():
+        old_info, new_info = old_db.get(key), new_db.get(key)
+        if old_info is None or new_info is None or old_info['keywords'] != new_info['keywords']:
+            for info in (old_info, new_info):
+                changed.update(info['keywords'] if info else ())
+    old_order = [key for key in old_db if key in new_db]
+    new_order = [key for key in new_db if key in old_db]
+    for old_key, new_key in zip(old_order, new_order):
+        if old_key != new_key:
+            changed.update(old_db[old_key]['keywords'])
+            changed.update(new_db[new_key]['keywords'])
+    return changed
+
+def invalidate_assignments(state, episodes, old_db, new_db):
+    """
+    Drops the cached classifications (see assign_episodes) that an edit from
+    old_db to new_db could change and marks the rest valid for new_db.
+    episodes is the feed's EpisodeTable. Only titles containing a changed
+    keyword can land somewhere else. Returns how many were dropped.
+    """
+    dropped = 0
+    keywords = changed_keywords(old_db, new_db)
+    if keywords:
+        probe = KeywordMatcher({"changed": {"keywords": sorted(keywords)}})
+        assignments = state.get('assignments', {})
+        for row, title in enumerate(episodes.titles):
+            if probe.find(title) and assignments.pop(episodes.key(row), None):
+                dropped += 1
+    state['knowledge_hash'] = knowledge_hash(new_db)
+    return dropped
+
+class LiveReloadHandler(SimpleHTTPRequestHandler):
+    """Serves the build directory, plus an event stream that fires once a newer build is written."""
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path != LIVE_RELOAD_PATH:
+            return super().do_GET()
+        query = parse_qs(parts.query)
+        since = int(query.get("since", ["0"])[0])
+        server = self.server
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            while True:
+                with server.changed:
+                    server.changed.wait_for(lambda: server.version != since, timeout=15)
+                # A comment line every 15 seconds notices closed tabs
+                self.wfile.write(b"data: reload\n\n" if server.version != since else b": ping\n\n")
+                self.wfile.flush()
+                if server.version != since:
+                    return
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+class LiveReloadServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port, directory):
+        super().__init__(("127.0.0.1", port), partial(LiveReloadHandler, directory=directory))
+        self.version = 0
+        self.changed = threading.Condition()
+
+    def notify(self, version):
+        with self.changed:
+            self.version = version
+            self.changed.notify_all()
+
+def watch(feed_paths, args, state=None):
+    """
+    Serves the page and rebuilds it whenever a feed file or KNOWLEDGE_BASE in
+    this script changes. Parsed feeds stay in memory, so only edited feeds
+    are re-read, and a knowledge base edit only reclassifies the episodes
+    whose titles contain a changed keyword. Open pages reload themselves.
+    state is the loaded --state file, saved again after every rebuild.
+    """
+    script = os.path.abspath(__file__)
+    server = LiveReloadServer(args.port, os.getcwd())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving http://127.0.0.1:{server.server_address[1]}/ and watching {', '.join(feed_paths)} and {script}")
+
+    db = KNOWLEDGE_BASE
+    matcher = KeywordMatcher(db)
+    feed_states = state.setdefault('feeds', {}) if state is not None else {}
+    feeds = {}  # path -> (mtime, EpisodeTable, feed state)
+    script_mtime = os.stat(script).st_mtime_ns
+    build = 0
+    try:
+        while True:
+            changed = False
+            for path in feed_paths:
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                    if path in feeds and feeds[path][0] == mtime:
+                        continue
+                    episodes = EpisodeTable(iter_rss_feed(path))
+                except (OSError, ET.ParseError) as e:
+                    print(f"Error reading {path}: {e}")
+                    continue
+                feed_state = feeds[path][2] if path in feeds else feed_states.get(path, {})
+                feeds[path] = (mtime, episodes, feed_state)
+                changed = True
+
+            mtime = os.stat(script).st_mtime_ns
+            if mtime != script_mtime:
+                script_mtime = mtime
+                try:
+                    new_db = load_knowledge_base(script)
+                except (OSError, SyntaxError, ValueError) as e:
+                    print(f"Can't read KNOWLEDGE_BASE from {script}: {e}")
+                    new_db = db
+                if new_db != db:
+                    dropped = sum(invalidate_assignments(feed_state, episodes, db, new_db)
+                                  for _, episodes, feed_state in feeds.values())
+                    print(f"KNOWLEDGE_BASE changed; {dropped} episodes may move.")
+                    for cycle in find_dependency_cycles(new_db):
+                        print(f"Warning: dependency cycle in KNOWLEDGE_BASE: {' -> '.join(cycle)}")
+                    db = new_db
+                    matcher = KeywordMatcher(db)
+                    changed = True
+                else:
+                    print(f"{script} changed outside KNOWLEDGE_BASE; restart --watch to pick that up.")
+
+            if changed and feeds:
+                start = time.perf_counter()
+                tables = [assign_episodes(episodes, db, matcher, feed_state) for _, episodes, feed_state in feeds.values()]
+                if build_site(merge_node_tables(tables), db, args, Metrics(enabled=False), live_reload=build + 1):
+                    build += 1
+                    server.notify(build)
+                    print(f"Rebuilt in {time.perf_counter() - start:.2f}s")
+                    if state is not None:
+                        state['feeds'] = {path: feeds[path][2] for path in feed_paths if path in feeds}
+                        save_state(args.state, state)
+            time.sleep(WATCH_INTERVAL)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        server.shutdown()
+
+# --- INSTRUMENTATION ---
+def peak_rss_bytes():
+    """The process's resident memory high-water mark, or None where getrusage isn't available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # kilobytes everywhere but macOS
+
+class Metrics:
+    """
+    Per-stage wall time and peak memory plus pipeline counters, for the
+    scheduler to alert on. Disabled instances record nothing and cost nothing.
+    Peak memory is the process's resident high-water mark by the end of each
+    stage, read from getrusage so measuring doesn't slow the stage down; it
+    doesn't cover feed-parsing workers.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stages = {}
+        self.counters = Counter()
+        self.keyword_hits = defaultdict(Counter)  # node id -> keyword -> episodes
+
+    def __bool__(self):
+        return self.enabled
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = {"seconds": time.perf_counter() - start}
+            peak = peak_rss_bytes()
+            if peak is not None:
+                self.stages[name]["peak_rss_bytes"] = peak
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            self.counters[name] += amount
+
+    def to_json(self):
+        return json.dumps({
+            "stages": self.stages,
+            "counters": dict(self.counters),
+            "keyword_hits": {node: dict(hits) for node, hits in self.keyword_hits.items()},
+        }, indent=2, sort_keys=True)
+
+    def to_prometheus(self):
+        def label(value):
+            return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        lines = [
+            "# HELP pel_stage_seconds Wall time of each build stage.",
+            "# TYPE pel_stage_seconds gauge",
+        ]
+        lines += [f'pel_stage_seconds{{stage="{label(name)}"}} {stage["seconds"]:.6f}' for name, stage in self.stages.items()]
+        lines += [
+            "# HELP pel_stage_peak_rss_bytes Peak resident memory of the process by the end of each build stage.",
+            "# TYPE pel_stage_peak_rss_bytes gauge",
+        ]
+        lines += [f'pel_stage_peak_rss_bytes{{stage="{label(name)}"}} {stage["peak_rss_bytes"]}'
+                  for name, stage in self.stages.items() if "peak_rss_bytes" in stage]
+        for name, value in sorted(self.counters.items()):
+            lines += [f"# TYPE pel_{name} gauge", f"pel_{name} {value}"]
+        lines += [
+            "# HELP pel_keyword_hits Episodes matched to a knowledge base node by each keyword.",
+            "# TYPE pel_keyword_hits gauge",
+        ]
+        for node, hits in sorted(self.keyword_hits.items()):
+            for keyword, value in sorted(hits.items()):
+                lines.append(f'pel_keyword_hits{{node="{label(node)}",keyword="{label(keyword)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+def record_classification(metrics, output_data, db):
+    """Counts where episodes landed: knowledge base (per keyword), inferred, topic bucket or general."""
+    if not metrics:
+        return
+    kb_matcher = KeywordMatcher(db)
+    for key, data in output_data.items():
+        episodes = data['episodes']
+        if key == "general":
+            metrics.count('matched_general_fallback', len(episodes))
+        elif data['category'] == "Inferred":
+            metrics.count('matched_inferred', len(episodes))
+        elif key in db:
+            metrics.count('matched_knowledge_base', len(episodes))
+            for title in episodes.column('title'):
+                hit = kb_matcher.find(title)
+                if hit:
+                    metrics.keyword_hits[key][hit[1]] += 1
+        else:
+            metrics.count('matched_topic_bucket', len(episodes))
+    metrics.count('nodes_total', len(output_data))
+
+def build_site(output_data, db, args, metrics, live_reload=None):
+    """
+    Every stage after ingest: resolve, finalize, layout, render and store.
+    Returns the final nodes, or None if no episodes were found.
+    """
+    # Counted before resolving, so inferred episodes folded into the KB still count as inferred
+    record_classification(metrics, output_data, db)
+    if not args.no_resolve:
+        with metrics.stage("resolve"):
+            metrics.count('inferred_nodes_merged', resolve_inferred_nodes(output_data, db, args.resolve_threshold))
+    with metrics.stage("finalize"):
+        final_data = finalize_nodes(output_data)
+    if not final_data:
+        print("No episodes found in XML.")
+        return None
+    metrics.count('nodes_active', len(final_data))
+
+    if args.layout:
+        if np is None:
+            print("numpy is not installed; skipping --layout, the page will simulate live.")
         else:
-            print("No episodes found in XML.")
\ No newline at end of file
+            with metrics.stage("layout"):
+                compute_layout(final_data, seed=args.layout_seed)
+
+    with metrics.stage("render"):
+        paths = generate_html(final_data, shard_dir=args.split_episodes, renderer=args.renderer,
+                              asset_dir=args.hashed_assets, live_reload=live_reload, minify=args.production,
+                              out=args.output, db=db)
+    if args.production:
+        if brotli is None:
+            print("brotli is not installed; writing .gz files only.")
+        with metrics.stage("compress"):
+            sizes = compress_artifacts(paths)
+        print_size_report(sizes)
+        for i, name in enumerate(("output_bytes", "output_bytes_gzip", "output_bytes_brotli")):
+            if i < 2 or brotli is not None:
+                metrics.count(name, sum(row[i] for row in sizes.values()))
+    if args.store:
+        with metrics.stage("store"):
+            store_episodes(args.store, final_data)
+    return final_data
+
+def metrics_report(metrics, args):
+    """Writes the --metrics report, if one was asked for."""
+    if metrics:
+        report = metrics.to_prometheus() if args.metrics_format == "prometheus" else metrics.to_json() + "\n"
+        if args.metrics == "-":
+            print(report, end="")
+        else:
+            with open(args.metrics, "w", encoding="utf-8") as f:
+                f.write(report)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["query"]:
+        return query_main(argv[1:])
+
+    parser = argparse.ArgumentParser(description="Builds the PEL mind map page from podcast RSS feeds.")
+    parser.add_argument("feeds", nargs="*", default=["pel.xml"],
+                        help="RSS files, directories of .xml/.rss files, or http(s) feed URLs to merge into one map (default: pel.xml)")
+    parser.add_argument("-j", "--jobs", type=int, help="Worker processes for parsing feeds (default: one per core)")
+    parser.add_argument("--feed-cache", metavar="DIR", default=".feed-cache",
+                        help="Where downloaded feeds and their ETag/Last-Modified validators are kept (default: .feed-cache)")
+    parser.add_argument("-o", "--output", default="index.html",
+                        help="Where to write the page, or '-' to stream it to stdout (default: index.html)")
+    parser.add_argument("--split-episodes", metavar="DIR", nargs="?", const="episodes",
+                        help="Write per-node episode lists as JSON shards in DIR (default: episodes) and load them on demand")
+    parser.add_argument("--resolve-threshold", type=resolve_threshold, default=RESOLVE_THRESHOLD,
+                        help=f"Name similarity (0-1) at which inferred nodes are merged with each other or "
+                             f"the knowledge base (default: {RESOLVE_THRESHOLD})")
+    parser.add_argument("--no-resolve", action="store_true", help="Keep every inferred name as its own node")
+    parser.add_argument("--layout", action="store_true",
+                        help="Precompute node positions at build time (needs numpy) so the page renders without a live simulation")
+    parser.add_argument("--layout-seed", type=int, default=42, help="Seed for --layout (default: 42)")
+    parser.add_argument("--renderer", choices=sorted(RENDERERS), default="svg",
+                        help="Draw the graph with SVG elements or on a canvas, which scales to thousands of nodes (default: svg)")
+    parser.add_argument("--hashed-assets", metavar="DIR", nargs="?", const="assets",
+                        help="Write data and script as content-hashed files in DIR (default: assets) with a manifest, "
+                             "leaving index.html as a small shell")
+    parser.add_argument("--production", action="store_true",
+                        help="Minify the page's CSS, JS and JSON and write .gz/.br copies of every output next to it "
+                             "(.br needs the brotli package), then print their sizes")
+    parser.add_argument("--store", metavar="DB",
+                        help="Also save nodes and episodes to this SQLite file, for `pel.py query DB ...`")
+    parser.add_argument("--watch", action="store_true",
+                        help="Serve the page, rebuild it when the feeds or KNOWLEDGE_BASE change, and reload open tabs")
+    parser.add_argument("--port", type=int, default=8000, help="Port for --watch (default: 8000)")
+    parser.add_argument("--state", help="JSON file remembering classified episodes, so reruns only classify new items")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Write stage timings, peak memory and classification counters to FILE ('-' for stdout)")
+    parser.add_argument("--metrics-format", choices=["json", "prometheus"], default="json",
+                        help="Format for --metrics (default: json)")
+    args = parser.parse_args(argv)
+
+    page_dir = "." if args.output == "-" else os.path.dirname(args.output) or "."
+    for option, directory in (("--split-episodes", args.split_episodes), ("--hashed-assets", args.hashed_assets)):
+        if directory:
+            try:
+                page_relative(page_dir, directory)
+            except ValueError as e:
+                parser.error(f"{option}: {e}")
+
+    if args.output == "-":
+        if args.watch or args.metrics == "-":
+            parser.error("--output - can't be combined with --watch or --metrics -")
+        # stdout carries only the page; progress messages go to stderr
+        args.output = sys.stdout.buffer
+        with redirect_stdout(sys.stderr):
+            return build(args)
+    return build(args)
+
+def build(args):
+    """Runs the whole pipeline for parsed command-line arguments."""
+    missing = [path for path in args.feeds if not is_feed_url(path) and not os.path.exists(path)]
+    if missing:
+        print(f"Error: {', '.join(missing)} not found. Please verify the file path.")
+        return
+    feed_paths = find_feed_files(args.feeds)
+    metrics = Metrics(enabled=bool(args.metrics))
+
+    # Remote feeds are refreshed into the cache and built from there. When every
+    # feed is a URL that came back unchanged and neither the script nor the
+    # options changed since the last build, the page is already up to date.
+    urls = [path for path in feed_paths if is_feed_url(path)]
+    if urls:
+        feed_cache = load_feed_cache(args.feed_cache)
+        with metrics.stage("fetch"):
+            fetched = fetch_feeds(urls, feed_cache, args.feed_cache)
+        unchanged = sum(not changed for _, changed in fetched.values())
+        metrics.count('feeds_not_modified', unchanged)
+        with open(__file__, "rb") as f:
+            options = {k: v for k, v in vars(args).items() if k not in ("jobs", "metrics", "metrics_format")}
+            # -o - has already been swapped for the stdout file object
+            options['output'] = args.output if isinstance(args.output, str) else "-"
+            build_key = hashlib.sha256(f.read() + json.dumps(options, sort_keys=True).encode("utf-8")).hexdigest()
+        if (not args.watch and len(urls) == len(feed_paths) and unchanged == len(urls) and feed_cache.get('build') == build_key
+                and isinstance(args.output, str) and os.path.exists(args.output)):
+            print("All feeds unchanged since the last build; nothing to do.")
+            save_feed_cache(args.feed_cache, feed_cache)
+            metrics_report(metrics, args)
+            return
+        feed_paths = [fetched[path][0] if is_feed_url(path) else path
+                      for path in feed_paths if not is_feed_url(path) or path in fetched]
+
+    # One state entry per feed, so workers only receive their own slice
+    state = load_state(args.state) if args.state else {}
+    feed_states = state.setdefault('feeds', {}) if args.state else None
+
+    for cycle in find_dependency_cycles(KNOWLEDGE_BASE):
+        print(f"Warning: dependency cycle in KNOWLEDGE_BASE: {' -> '.join(cycle)}")
+
+    if args.watch:
+        return watch(feed_paths, args, state if args.state else None)
+
+    with metrics.stage("ingest"):
+        output_data = ingest_feeds(feed_paths, KNOWLEDGE_BASE, feed_states, jobs=args.jobs, metrics=metrics)
+    if not output_data:
+        print("No episodes found in XML.")
+        return
+    final_data = build_site(output_data, KNOWLEDGE_BASE, args, metrics)
+    if final_data is None:
+        return
+    if args.state:
+        # Forget feeds that weren't part of this build
+        state['feeds'] = {path: feed_states[path] for path in feed_paths if path in feed_states}
+        save_state(args.state, state)
+    if urls:
+        # Saved only after a successful build, so a failed one is retried next run
+        feed_cache['build'] = build_key
+        save_feed_cache(args.feed_cache, feed_cache)
+
+    metrics_report(metrics, args)
+
+if __name__ == "__main__":
+    main()
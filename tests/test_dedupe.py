@@ -0,0 +1,37 @@
+import pel
+
+def write_feed(path, items):
+    body = "".join(f"<item>{item}</item>" for item in items)
+    path.write_text(f'<?xml version="1.0"?><rss><channel>{body}</channel></rss>', encoding="utf-8")
+    return str(path)
+
+def episode_count(output_data):
+    return sum(len(data['episodes']) for data in output_data.values())
+
+def test_items_without_guid_or_link_are_all_kept(tmp_path, capsys):
+    feed = write_feed(tmp_path / "feed.xml", [f"<title>Nightcap: Topic {i}</title>" for i in range(5)])
+    output_data = pel.ingest_feeds([feed], pel.KNOWLEDGE_BASE)
+    assert episode_count(output_data) == 5
+    assert len({pel.episode_key(ep) for data in output_data.values() for ep in data['episodes']}) == 5
+
+def test_guid_and_link_dedupe_separately(tmp_path, capsys):
+    with_guid = write_feed(tmp_path / "a.xml", [
+        "<title>Ep. 1: Hegel on Logic</title><link>https://example.com/1</link><guid>g1</guid>",
+        "<title>Ep. 2: Kant on Ethics</title><link>https://example.com/2</link><guid>g2</guid>",
+    ])
+    link_only = write_feed(tmp_path / "b.xml", [
+        "<title>Ep. 1: Hegel on Logic</title><link>https://example.com/1</link>",
+        "<title>Ep. 3: Hume on Causes</title><link>https://example.com/3</link>",
+    ])
+    guid_only = write_feed(tmp_path / "c.xml", [
+        "<title>Ep. 2: Kant on Ethics</title><guid>g2</guid>",
+    ])
+    output_data = pel.ingest_feeds([with_guid, link_only, guid_only], pel.KNOWLEDGE_BASE, jobs=1)
+    assert episode_count(output_data) == 3
+
+def test_store_keeps_items_without_guid_or_link(tmp_path, capsys):
+    feed = write_feed(tmp_path / "feed.xml", [f"<title>Nightcap: Topic {i}</title>" for i in range(5)])
+    final_data = pel.finalize_nodes(pel.ingest_feeds([feed], pel.KNOWLEDGE_BASE))
+    store = str(tmp_path / "store.db")
+    pel.store_episodes(store, final_data)
+    assert len(pel.query_episodes(store)) == 5
@@ -0,0 +1,123 @@
+import gzip
+import hashlib
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import pel
+
+FEED = (b'<?xml version="1.0"?><rss><channel>'
+        b'<item><title>Ep. 1: Hegel on Logic</title><link>https://example.com/1</link><guid>1</guid></item>'
+        b'<item><title>Ep. 2: Kant on Ethics</title><link>https://example.com/2</link><guid>2</guid></item>'
+        b'</channel></rss>')
+ETAG = '"' + hashlib.sha256(FEED).hexdigest()[:16] + '"'
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Stand-in feed server: ETag validation, gzip, redirects and keep-alive."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.client_address[1], dict(self.headers)))
+        server.sockets.append(self.connection)
+        if self.path == "/old.xml":
+            return self.reply(301, headers={"Location": "/feed.xml"})
+        if self.path == "/loop.xml":
+            return self.reply(302, headers={"Location": "/loop.xml"})
+        if self.path != "/feed.xml":
+            return self.reply(404)
+        if self.headers.get("If-None-Match") == ETAG:
+            return self.reply(304, headers={"ETag": ETAG})
+        gzipped = "gzip" in (self.headers.get("Accept-Encoding") or "")
+        self.reply(200, gzip.compress(FEED) if gzipped else FEED,
+                   {"ETag": ETAG, **({"Content-Encoding": "gzip"} if gzipped else {})})
+
+    def reply(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    httpd.daemon_threads = True
+    httpd.requests, httpd.sockets = [], []
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_fetch_then_not_modified(server, tmp_path):
+    url, cache = server.url + "/feed.xml", {}
+    results = pel.fetch_feeds([url], cache, str(tmp_path))
+    path, changed = results[url]
+    assert changed
+    with open(path, "rb") as f:
+        assert f.read() == FEED  # served gzipped, stored plain
+    entry = cache['feeds'][url]
+    assert entry['etag'] == ETAG and entry['sha256'] == hashlib.sha256(FEED).hexdigest()
+    assert "gzip" in server.requests[0][2]["Accept-Encoding"]
+
+    assert pel.fetch_feeds([url], cache, str(tmp_path))[url] == (path, False)
+    assert server.requests[-1][2]["If-None-Match"] == ETAG
+
+def test_redirects_are_followed_over_one_connection(server, tmp_path):
+    pool = pel.ConnectionPool()
+    try:
+        assert pel.fetch_feed(pool, server.url + "/old.xml", {}, str(tmp_path))
+        assert pel.fetch_feed(pool, server.url + "/feed.xml", {}, str(tmp_path))
+    finally:
+        pool.close()
+    assert [path for path, _, _ in server.requests] == ["/old.xml", "/feed.xml", "/feed.xml"]
+    assert len({port for _, port, _ in server.requests}) == 1
+    with open(pel.feed_cache_path(str(tmp_path), server.url + "/old.xml"), "rb") as f:
+        assert f.read() == FEED
+
+def test_redirect_loops_give_up(server, tmp_path):
+    pool = pel.ConnectionPool()
+    try:
+        with pytest.raises(OSError, match="too many redirects"):
+            pel.fetch_feed(pool, server.url + "/loop.xml", {}, str(tmp_path))
+    finally:
+        pool.close()
+    assert len(server.requests) == pel.FETCH_MAX_REDIRECTS + 1
+
+def test_stale_keep_alive_connection_is_replaced(server, tmp_path):
+    url, entry = server.url + "/feed.xml", {}
+    pool = pel.ConnectionPool()
+    try:
+        assert pel.fetch_feed(pool, url, entry, str(tmp_path))
+        # The server drops the idle keep-alive connection behind the pool's back
+        server.sockets[-1].shutdown(socket.SHUT_RDWR)
+        assert not pel.fetch_feed(pool, url, entry, str(tmp_path))
+    finally:
+        pool.close()
+    assert len({port for _, port, _ in server.requests}) == 2
+
+def test_failed_fetch_falls_back_to_the_cached_copy(server, tmp_path, capsys):
+    url, missing, cache = server.url + "/feed.xml", server.url + "/missing.xml", {}
+    path, _ = pel.fetch_feeds([url], cache, str(tmp_path))[url]
+    server.shutdown()
+    server.server_close()
+    results = pel.fetch_feeds([url, missing], cache, str(tmp_path))
+    assert results == {url: (path, False)}
+    out = capsys.readouterr().out
+    assert f"Error fetching {url}" in out and "using the cached copy" in out
+    assert f"Error fetching {missing}" in out
+
+def test_remote_feed_to_stdout(server, tmp_path, monkeypatch, capfdbinary):
+    monkeypatch.chdir(tmp_path)
+    pel.main([server.url + "/feed.xml", "-o", "-", "--feed-cache", str(tmp_path / "cache")])
+    out, err = capfdbinary.readouterr()
+    assert out.startswith(b"\n<!DOCTYPE html>") and b"Hegel on Logic" in out
+    assert b"Error" not in err
@@ -0,0 +1,63 @@
+import copy
+import json
+import random
+
+import pytest
+
+import pel
+
+def feed(db, count=600, seed=0):
+    rng = random.Random(seed)
+    keywords = [keyword for info in db.values() for keyword in info['keywords']] + ["Logic", "Anna Marber", "Free Will"]
+    return pel.EpisodeTable({
+        "title": f"Ep. {i}: {rng.choice(keywords)} and {rng.choice(keywords)} on {rng.choice(keywords)}",
+        "link": f"https://example.com/{i}",
+        "guid": str(i),
+    } for i in range(count))
+
+def move_to_front(db, key):
+    return {key: db[key], **{k: v for k, v in db.items() if k != key}}
+
+def edit_keyword(db):
+    db = copy.deepcopy(db)
+    db['kant']['keywords'] = ["Kant", "Logic"]
+    return db
+
+def reorder_keywords(db):
+    db = copy.deepcopy(db)
+    db['kierkegaard']['keywords'].reverse()
+    return db
+
+def add_and_remove(db):
+    db = {k: v for k, v in copy.deepcopy(db).items() if k != 'hume'}
+    db['marber'] = {"name": "Anna Marber", "category": "Modern", "sep": "", "deps": [], "keywords": ["Marber"]}
+    return db
+
+EDITS = {
+    "keyword": edit_keyword,
+    "keyword order": reorder_keywords,
+    "entry order": lambda db: move_to_front(db, 'nietzsche'),
+    "all": lambda db: move_to_front(add_and_remove(reorder_keywords(edit_keyword(db))), 'marber'),
+}
+
+def snapshot(output_data):
+    nodes = pel.finalize_nodes(output_data)
+    return json.dumps([{**node, "episodes": [ep['guid'] for ep in node['episodes']]} for node in nodes], sort_keys=True)
+
+@pytest.mark.parametrize("edit", EDITS)
+def test_incremental_rebuild_matches_full_rebuild(edit, capsys):
+    old_db = pel.KNOWLEDGE_BASE
+    new_db = EDITS[edit](old_db)
+    table = feed(old_db)
+    state = {}
+    pel.assign_episodes(table, old_db, state=state)
+
+    dropped = pel.invalidate_assignments(state, table, old_db, new_db)
+    assert 0 < dropped < len(table.titles)
+    incremental = pel.assign_episodes(table, new_db, state=state)
+    assert "reclassifying everything" not in capsys.readouterr().out
+
+    fresh_state = {}
+    fresh = pel.assign_episodes(table, new_db, state=fresh_state)
+    assert snapshot(incremental) == snapshot(fresh)
+    assert state == fresh_state
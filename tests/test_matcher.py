@@ -0,0 +1,45 @@
+import random
+
+import pel
+
+def nested_loops(entries, title):
+    """The matching loop KeywordMatcher replaced: first entry in dict order, then first keyword in list order."""
+    title_lower = pel.normalize(title)
+    for key, info in entries.items():
+        for keyword in info['keywords']:
+            if pel.normalize(keyword) in title_lower:
+                return key, keyword
+    return None
+
+def test_keyword_order_breaks_ties_within_an_entry():
+    entries = {
+        "kierkegaard": {"keywords": ["Kierkegaard", "Sickness Unto Death", "Either/Or"]},
+        "nietzsche": {"keywords": ["Nietzsche", "Zarathustra"]},
+    }
+    matcher = pel.KeywordMatcher(entries)
+    title = "Either/Or and The Sickness Unto Death: Kierkegaard after Nietzsche"
+    assert matcher.find(title) == ("kierkegaard", "Kierkegaard") == nested_loops(entries, title)
+    title = "Either/Or and The Sickness Unto Death"
+    assert matcher.find(title) == ("kierkegaard", "Sickness Unto Death") == nested_loops(entries, title)
+    assert matcher.hits(title) == [("kierkegaard", "Sickness Unto Death"), ("kierkegaard", "Either/Or")]
+
+def test_matches_nested_loops_on_overlapping_keywords():
+    rng = random.Random(3)
+    words = ["ab", "ba", "abc", "bca", "cab", "a b", "b c", "abab"]
+    for _ in range(200):
+        entries = {f"e{i}": {"keywords": rng.sample(words, rng.randint(1, 4))} for i in range(rng.randint(1, 6))}
+        matcher = pel.KeywordMatcher(entries)
+        for _ in range(20):
+            title = "".join(rng.choice("abc ") for _ in range(rng.randint(0, 12)))
+            expected = nested_loops(entries, title)
+            assert matcher.find(title) == expected, (entries, title)
+            assert matcher.match(title) == (expected[0] if expected else None)
+
+def test_matches_nested_loops_on_the_knowledge_base():
+    rng = random.Random(0)
+    names = [keyword for info in pel.KNOWLEDGE_BASE.values() for keyword in info['keywords']]
+    for table in (pel.KNOWLEDGE_BASE, pel.TOPIC_BUCKETS):
+        matcher = pel.KeywordMatcher(table)
+        for number in range(2000):
+            title = f"Ep. {number}: {rng.choice(names)} and {rng.choice(names)} on {rng.choice(names)}"
+            assert matcher.find(title) == nested_loops(table, title), title
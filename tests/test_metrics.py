@@ -0,0 +1,23 @@
+import json
+import tracemalloc
+
+import pel
+
+def test_stages_are_timed_without_tracing():
+    metrics = pel.Metrics()
+    with metrics.stage("ingest"):
+        assert not tracemalloc.is_tracing()
+        blob = bytearray(8 << 20)
+    del blob
+    stage = metrics.stages["ingest"]
+    assert stage["seconds"] >= 0
+    assert stage["peak_rss_bytes"] >= 8 << 20
+    assert json.loads(metrics.to_json())["stages"]["ingest"] == stage
+    assert f'pel_stage_peak_rss_bytes{{stage="ingest"}} {stage["peak_rss_bytes"]}' in metrics.to_prometheus()
+
+def test_disabled_metrics_record_nothing():
+    metrics = pel.Metrics(enabled=False)
+    with metrics.stage("ingest"):
+        pass
+    metrics.count("items_parsed")
+    assert not metrics.stages and not metrics.counters
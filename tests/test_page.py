@@ -0,0 +1,11 @@
+import pel
+
+def test_page_has_no_raw_template_escapes(tmp_path, capsys):
+    table = pel.EpisodeTable([{"title": "Ep. 1", "link": "https://example.com/1", "pub_date": "2024-01-02T00:00:00+00:00"}])
+    node = {"id": "general", "name": "General", "category": "Topic", "sep_link": None, "dependencies": [],
+            "episodes": pel.NodeEpisodes(table, [0])}
+    out = tmp_path / "index.html"
+    pel.generate_html([node], out=str(out))
+    page = out.read_text(encoding="utf-8")
+    assert chr(0xFFFF) not in page
+    assert 'to + "\\uffff"' in page
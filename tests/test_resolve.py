@@ -0,0 +1,143 @@
+import json
+import random
+
+import pytest
+
+import pel
+
+SYLLABLES = ["ka", "ren", "tho", "vel", "mar", "sti", "lo", "ber", "quin", "dra", "zel", "mon", "fi", "gar", "sch", "ei"]
+
+def osa_distance(a, b):
+    """Unbanded optimal string alignment distance, the reference for name_similarity."""
+    d = [[i + j if i * j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[-1][-1]
+
+def random_name(rng):
+    words = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(rng.randint(1, 3))]
+    return " ".join(words)
+
+def mutate(rng, name, edits):
+    """Applies random substitutions, insertions, deletions and transpositions."""
+    for _ in range(edits):
+        i = rng.randrange(len(name))
+        kind = rng.randrange(4)
+        if kind == 0:
+            name = name[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + name[i + 1:]
+        elif kind == 1:
+            name = name[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + name[i:]
+        elif kind == 2 and len(name) > 1:
+            name = name[:i] + name[i + 1:]
+        elif i + 1 < len(name):
+            name = name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    return name
+
+def test_name_similarity_matches_full_dp():
+    rng = random.Random(1)
+    for _ in range(3000):
+        a = random_name(rng)
+        b = mutate(rng, a, rng.randint(0, 4))
+        threshold = rng.choice([0.0, 0.7, 0.85, 0.95])
+        full = 1 - osa_distance(a, b) / max(len(a), len(b), 1)
+        banded = pel.name_similarity(a, b, threshold)
+        if full >= threshold:
+            assert banded == pytest.approx(full)
+        else:
+            assert banded < threshold
+
+@pytest.mark.parametrize("threshold", [0.7, 0.85, 0.95])
+def test_candidates_match_brute_force(threshold):
+    rng = random.Random(threshold)
+    index = pel.NameIndex()
+    indexed = []
+    for i in range(400):
+        form = pel.entity_form(random_name(rng))
+        index.add(form, i)
+        indexed.append((form, i))
+    queries = [mutate(rng, form, rng.randint(1, 3)) for form, _ in indexed[:300]] + [random_name(rng) for _ in range(100)]
+    for query in queries:
+        if not query.strip():
+            continue
+        expected = {
+            (form, owner) for form, owner in indexed
+            if pel.name_similarity(pel.last_word(query), pel.last_word(form), threshold) >= threshold
+            and pel.name_similarity(query, form, threshold) >= threshold
+        }
+        assert set(index.candidates(query, threshold)) == expected, query
+
+def test_single_transpositions_are_candidates():
+    rng = random.Random(7)
+    index = pel.NameIndex()
+    for i in range(200):
+        index.add(pel.entity_form(random_name(rng)), i)
+    for form in list(index.forms):
+        for i in range(len(form) - 1):
+            if form[i] == form[i + 1] or " " in form[i:i + 2]:
+                continue
+            typo = form[:i] + form[i + 1] + form[i] + form[i + 2:]
+            if pel.name_similarity(typo, form, pel.RESOLVE_THRESHOLD) >= pel.RESOLVE_THRESHOLD and \
+                    pel.name_similarity(pel.last_word(typo), pel.last_word(form), pel.RESOLVE_THRESHOLD) >= pel.RESOLVE_THRESHOLD:
+                assert form in {found for found, _ in index.candidates(typo)}, typo
+
+def test_interview_suffix_is_noise(capsys):
+    titles = ["Anna Marber Interview on Time", "Ep. 2: Anna Marber on Time", "Karin Zelstilo Interview on Love"]
+    output_data = pel.assign_episodes([{"title": t, "link": f"https://example.com/{i}", "guid": str(i)} for i, t in enumerate(titles)], pel.KNOWLEDGE_BASE)
+    assert pel.entity_form("Anna Marber Interview") == "anna marber"
+    assert pel.resolve_inferred_nodes(output_data, pel.KNOWLEDGE_BASE) == 1
+    assert sorted(data['name'] for data in output_data.values() if data['category'] == 'Inferred') == ["Anna Marber", "Karin Zelstilo Interview"]
+
+@pytest.mark.parametrize("typo, key", [
+    ("Neitzsche", "nietzsche"),
+    ("Nietszche", "nietzsche"),
+    ("Hiedegger", "heidegger"),
+    ("Keirkegaard", "kierkegaard"),
+])
+def test_transposed_names_fold_into_knowledge_base(typo, key, capsys):
+    episodes = [{"title": f"Ep. {i}: {typo} on Everything", "link": f"https://example.com/{i}", "guid": str(i)} for i in range(3)]
+    output_data = pel.assign_episodes(episodes, pel.KNOWLEDGE_BASE)
+    inferred = pel.normalize(typo).replace(" ", "_")
+    assert inferred in output_data
+    pel.resolve_inferred_nodes(output_data, pel.KNOWLEDGE_BASE)
+    assert inferred not in output_data
+    assert len(output_data[key]['episodes']) == 3
+
+@pytest.mark.parametrize("title", [
+    "Death on Trial",         # "Sickness Unto Death" (Kierkegaard)
+    "Science's Limits",       # "Gay Science" (Nietzsche)
+    "Evil on Trial",          # "Beyond Good and Evil" (Nietzsche)
+    "Prince on Purple Rain",  # "The Prince" (Machiavelli)
+    "Anima on Film",          # "De Anima" (Aristotle)
+    "Meditation on Breath",   # "Meditations" (Descartes)
+    "Poetic on Form",         # "Poetics" (Aristotle)
+])
+def test_works_named_in_keywords_are_not_people(title, capsys):
+    output_data = pel.assign_episodes([{"title": f"Ep. 1: {title}", "link": "https://example.com/1", "guid": "1"}], pel.KNOWLEDGE_BASE)
+    inferred = [key for key, data in output_data.items() if data['category'] == 'Inferred']
+    assert inferred
+    assert pel.resolve_inferred_nodes(output_data, pel.KNOWLEDGE_BASE) == 0
+    assert [key for key, data in output_data.items() if data['category'] == 'Inferred'] == inferred
+
+@pytest.mark.parametrize("value", ["0", "-0.5", "1.5", "nan"])
+def test_resolve_threshold_must_be_a_similarity(value):
+    with pytest.raises(SystemExit):
+        pel.main(["--resolve-threshold", value, "missing.xml"])
+    with pytest.raises(ValueError):
+        pel.resolve_inferred_nodes({}, pel.KNOWLEDGE_BASE, float(value))
+
+def test_metrics_count_classification_before_resolving(tmp_path, monkeypatch, capsys):
+    feed = tmp_path / "feed.xml"
+    items = "".join(
+        f"<item><title>Ep. {i}: Neitzsche on Morality</title><link>https://example.com/{i}</link><guid>{i}</guid></item>"
+        for i in range(3)
+    )
+    feed.write_text(f'<?xml version="1.0"?><rss><channel>{items}</channel></rss>', encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    pel.main([str(feed), "--metrics", "metrics.json"])
+    counters = json.loads((tmp_path / "metrics.json").read_text())["counters"]
+    assert counters["matched_inferred"] == 3
+    assert counters.get("matched_knowledge_base", 0) == 0
+    assert counters["inferred_nodes_merged"] == 1
@@ -0,0 +1,43 @@
+import re
+
+import pytest
+
+import pel
+
+def node(i, episodes=1):
+    table = pel.EpisodeTable({"title": f"Ep {i}.{j}", "link": f"https://example.com/{i}/{j}"} for j in range(episodes))
+    return {"id": f"n{i}", "name": f"N{i}", "category": "Topic", "sep_link": None, "dependencies": [],
+            "episodes": pel.NodeEpisodes(table, range(episodes))}
+
+def test_pruning_only_removes_stale_shards(tmp_path):
+    shard_dir = tmp_path / "episodes"
+    shard_dir.mkdir()
+    for name in ("package.json", "notes.json", "index.json", "7.json", "7.json.gz", "7.json.br", "1.json"):
+        (shard_dir / name).write_text("{}")
+    pel.write_episode_shards([node(0), node(1)], str(shard_dir), page_dir=str(tmp_path))
+    assert sorted(p.name for p in shard_dir.iterdir()) == ["0.json", "1.json", "index.json", "notes.json", "package.json"]
+
+def test_urls_are_relative_to_the_page(tmp_path):
+    page_dir = tmp_path / "out"
+    assert pel.url_path(str(page_dir), str(page_dir / "eps"), "0.json") == "eps/0.json"
+    assert pel.url_path(str(page_dir), str(page_dir), "0.json") == "0.json"
+    assert pel.url_path(".", "assets", "app.js") == "assets/app.js"
+    with pytest.raises(ValueError):
+        pel.url_path(str(page_dir), str(tmp_path / "eps"), "0.json")
+
+def test_page_loads_shards_and_assets_relative_to_itself(tmp_path, capsys):
+    out = tmp_path / "out" / "index.html"
+    pel.generate_html([node(0)], shard_dir=str(tmp_path / "out" / "eps"), asset_dir=str(tmp_path / "out" / "assets"),
+                      out=str(out))
+    page = out.read_text(encoding="utf-8")
+    scripts = re.findall(r'<script src="(assets/[^"]+)"', page)
+    assert len(scripts) == 2 and all((out.parent / src).exists() for src in scripts)
+    data = (out.parent / scripts[0]).read_text(encoding="utf-8")
+    shard = re.search(r'"shard":"([^"]+)"', data)[1]
+    assert shard.startswith("eps/") and (out.parent / shard).exists()
+
+def test_directories_outside_the_page_are_refused(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit):
+        pel.main(["--hashed-assets", "-o", "out/index.html", "feed.xml"])
+    assert "outside" in capsys.readouterr().err
@@ -0,0 +1,65 @@
+import copy
+
+import pytest
+
+import pel
+
+def episode(guid, title):
+    return {"title": title, "link": f"https://example.com/{guid}", "guid": guid}
+
+@pytest.fixture
+def classified(monkeypatch):
+    """Titles classify_title was actually called on."""
+    calls = []
+    classify = pel.classify_title
+
+    def counting(title, *args):
+        calls.append(title)
+        return classify(title, *args)
+
+    monkeypatch.setattr(pel, "classify_title", counting)
+    return calls
+
+def node_of(output_data, guid):
+    for node_id, data in output_data.items():
+        if any(ep['guid'] == guid for ep in data['episodes']):
+            return node_id
+
+def test_unchanged_titles_are_reused(classified, capsys):
+    state = {}
+    episodes = [episode("1", "Ep. 1: Hegel on Logic"), episode("2", "Ep. 2: Anna Marber on Time")]
+    first = pel.assign_episodes(episodes, pel.KNOWLEDGE_BASE, state=state)
+    assert len(classified) == 2 and set(state['assignments']) == {"1", "2"}
+
+    # A stale assignment for an unchanged title is trusted as is
+    state['assignments']["2"][1:] = ["kant", None]
+    second = pel.assign_episodes(episodes, pel.KNOWLEDGE_BASE, state=state)
+    assert len(classified) == 2
+    assert node_of(first, "1") == node_of(second, "1") == "hegel"
+    assert node_of(second, "2") == "kant"
+
+def test_changed_titles_are_reclassified(classified, capsys):
+    state = {}
+    pel.assign_episodes([episode("1", "Ep. 1: Hegel on Logic")], pel.KNOWLEDGE_BASE, state=state)
+    output_data = pel.assign_episodes([episode("1", "Ep. 1: Kant on Logic")], pel.KNOWLEDGE_BASE, state=state)
+    assert classified == ["Ep. 1: Hegel on Logic", "Ep. 1: Kant on Logic"]
+    assert node_of(output_data, "1") == "kant"
+    assert state['assignments']["1"] == ["Ep. 1: Kant on Logic", "kant", None]
+
+def test_knowledge_base_change_resets_everything(classified, capsys):
+    state = {}
+    episodes = [episode("1", "Ep. 1: Hegel on Logic"), episode("2", "Ep. 2: Anna Marber on Time")]
+    pel.assign_episodes(episodes, pel.KNOWLEDGE_BASE, state=state)
+    db = copy.deepcopy(pel.KNOWLEDGE_BASE)
+    db['marber'] = {"name": "Anna Marber", "category": "Modern", "sep": "", "deps": [], "keywords": ["Marber"]}
+    output_data = pel.assign_episodes(episodes, db, state=state)
+    assert len(classified) == 4
+    assert "reclassifying everything" in capsys.readouterr().out
+    assert node_of(output_data, "2") == "marber"
+    assert state['knowledge_hash'] == pel.knowledge_hash(db)
+
+def test_items_that_left_the_feed_are_pruned(capsys):
+    state = {}
+    pel.assign_episodes([episode("1", "Ep. 1: Hegel on Logic"), episode("2", "Ep. 2: Kant on Logic")], pel.KNOWLEDGE_BASE, state=state)
+    pel.assign_episodes([episode("2", "Ep. 2: Kant on Logic"), episode("3", "Ep. 3: Hume on Causes")], pel.KNOWLEDGE_BASE, state=state)
+    assert set(state['assignments']) == {"2", "3"}
@@ -0,0 +1,32 @@
+import copy
+import json
+
+import pel
+
+FEED = ('<?xml version="1.0"?><rss><channel>'
+        '<item><title>Ep. 1: Hegel on Logic</title><link>https://example.com/1</link><guid>1</guid></item>'
+        '<item><title>Ep. 2: Kant on Ethics</title><link>https://example.com/2</link><guid>2</guid></item>'
+        '</channel></rss>')
+
+def test_search_index_uses_the_given_knowledge_base(tmp_path, capsys):
+    db = copy.deepcopy(pel.KNOWLEDGE_BASE)
+    db['hegel']['keywords'].append("Phenomenology of Geist")
+    (tmp_path / "feed.xml").write_text(FEED, encoding="utf-8")
+    final_data = pel.finalize_nodes(pel.assign_episodes(pel.iter_rss_feed(str(tmp_path / "feed.xml")), db))
+    out = tmp_path / "index.html"
+    pel.generate_html(final_data, out=str(out), db=db)
+    assert '"geist"' in out.read_text(encoding="utf-8")
+
+def test_watch_saves_state_after_each_rebuild(tmp_path, monkeypatch, capsys):
+    (tmp_path / "feed.xml").write_text(FEED, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    def stop(seconds):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(pel.time, "sleep", stop)
+    pel.main(["feed.xml", "--watch", "--port", "0", "--state", "state.json"])
+
+    state = json.loads((tmp_path / "state.json").read_text())
+    assignments = state['feeds']['feed.xml']['assignments']
+    assert assignments["1"][1] == "hegel" and assignments["2"][1] == "kant"
+    assert (tmp_path / "index.html").exists()